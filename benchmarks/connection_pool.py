@@ -0,0 +1,125 @@
+"""Measure the reuse of connections by many clients, with a pool per client or a shared pool.
+
+$ python benchmarks/connection_pool.py --clients 50 --rounds 20 --concurrency 10
+
+The clients request `live_status` to a local stand-in server of the REST API,
+at most `--concurrency` requests at once, and the server counts the TCP connections that the clients opened.
+"""
+
+import argparse
+import asyncio
+import time
+
+from aiohttp import web
+
+from chzzkpy.connection_pool import ConnectionPool
+from chzzkpy.http import ChzzkAPISession
+
+import fixtures
+
+
+class StandInServer:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.connections: set[tuple] = set()
+        self.requests: int = 0
+        self._runner = None
+        self.url = None
+
+    async def live_status(self, request: web.Request) -> web.Response:
+        self.connections.add(request.transport.get_extra_info("sockname"))
+        self.connections.add(request.transport.get_extra_info("peername"))
+        self.requests += 1
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
+        return web.json_response(
+            {"code": 200, "message": None, "content": fixtures.live_status()}
+        )
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get(
+            "/polling/v2/channels/{channel_id}/live-status", self.live_status
+        )
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = site._server.sockets[0].getsockname()[:2]
+        self.url = f"http://{host}:{port}"
+
+    async def close(self) -> None:
+        await self._runner.cleanup()
+
+
+async def run(
+    server: StandInServer, pools: list[ConnectionPool], rounds: int, concurrency: int
+):
+    server.connections.clear()
+    server.requests = 0
+    sessions = [
+        ChzzkAPISession(base_url=server.url, **pool.session_options()) for pool in pools
+    ]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(index: int, session: ChzzkAPISession):
+        async with semaphore:
+            await session.live_status(channel_id=f"{index:032x}")
+
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(
+            *[request(index, session) for index, session in enumerate(sessions)]
+        )
+    elapsed = time.perf_counter() - started_at
+
+    for session in sessions:
+        await session.close()
+    for pool in set(pools):
+        await pool.close()
+    # The server sees the address of the server and each client.
+    return len(server.connections) - 1, server.requests / elapsed
+
+
+async def main_async(args):
+    server = StandInServer(args.delay / 1000)
+    await server.start()
+
+    def pool() -> ConnectionPool:
+        return ConnectionPool(
+            limit=args.limit,
+            limit_per_host=args.limit_per_host,
+            keepalive_timeout=args.keepalive_timeout,
+        )
+
+    shared_pool = pool()
+    cases = {
+        "pool per client": [pool() for _ in range(args.clients)],
+        "shared pool": [shared_pool] * args.clients,
+    }
+
+    print(f"{'case':<18}{'connections':>14}{'requests/s':>14}")
+    for name, pools in cases.items():
+        connections, throughput = await run(
+            server, pools, args.rounds, args.concurrency
+        )
+        print(f"{name:<18}{connections:>14,}{throughput:>14,.0f}")
+    await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--delay", type=float, default=1.0, help="delay of server (ms)")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--limit-per-host", type=int, default=0)
+    parser.add_argument("--keepalive-timeout", type=float, default=15.0)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""Realistic payloads of Chzzk for benchmarks.
+The values are anonymized, but the shape of data is the same as the chat server sends.
+"""
+
+import json
+import time
+
+CHAT_CHANNEL_ID = "N1SGD0"
+STREAMING_CHANNEL_ID = "0000000000000000000000000000abcd"
+
+
+def profile(user_index: int = 0) -> dict:
+    return {
+        "userIdHash": f"{user_index:032x}",
+        "nickname": f"viewer{user_index}",
+        "profileImageUrl": "https://nng-phinf.pstatic.net/MjAyNDA1MDNfMTk5/profile.png",
+        "userRoleCode": "common_user",
+        "badge": {
+            "imageUrl": "https://ssl.pstatic.net/static/nng/glive/icon/streamer.png"
+        },
+        "title": {"name": "Subscriber", "color": "#D9B04F"},
+        "verifiedMark": False,
+        "activityBadges": [
+            {
+                "badgeNo": 1,
+                "badgeId": "subscription_founder",
+                "imageUrl": "https://nng-phinf.pstatic.net/glive/subscription/badge.png",
+                "activated": True,
+            }
+        ],
+        "streamingProperty": {
+            "following": {"followDate": "2024-03-01 12:00:00"},
+            "realTimeDonationRanking": {
+                "badge": json.dumps(
+                    {
+                        "name": "1st",
+                        "imageUrl": "https://ssl.pstatic.net/static/nng/glive/rank.png",
+                    }
+                )
+            },
+        },
+    }
+
+
+def extras(**kwargs) -> dict:
+    data = {
+        "chatType": "STREAMING",
+        "emojis": {},
+        "osType": "PC",
+        "streamingChannelId": STREAMING_CHANNEL_ID,
+    }
+    data.update(kwargs)
+    return data
+
+
+def chat_message(index: int = 0, user_index: int = 0, **kwargs) -> dict:
+    message_time = int(time.time() * 1000) + index
+    data = {
+        "svcid": "game",
+        "cid": CHAT_CHANNEL_ID,
+        "mbrCnt": 1234,
+        "uid": f"{user_index:032x}",
+        "profile": json.dumps(profile(user_index)),
+        "msg": f"hello chzzk {index}",
+        "msgTypeCode": 1,
+        "msgStatusType": "NORMAL",
+        "extras": json.dumps(extras()),
+        "ctime": message_time,
+        "utime": message_time,
+        "msgTid": None,
+        "msgTime": message_time,
+    }
+    data.update(kwargs)
+    return data
+
+
+def donation_message(index: int = 0, donation_type: str = "CHAT") -> dict:
+    extra = extras(
+        isAnonymous=False,
+        payType="CURRENCY",
+        payAmount=1000,
+        donationType=donation_type,
+        weeklyRankList=[
+            {
+                "userIdHash": f"{rank:032x}",
+                "nickName": f"viewer{rank}",
+                "verifiedMark": False,
+                "donationAmount": 10000 - rank,
+                "ranking": rank + 1,
+            }
+            for rank in range(10)
+        ],
+    )
+    if donation_type == "MISSION":
+        extra.update(
+            durationTime=180,
+            missionDonationId="mission-1",
+            missionDonationType="ALONE",
+            missionCreatedTime="2024-05-01 12:00:00",
+            missionText="Sing a song",
+            status="PENDING",
+            success=False,
+        )
+    return chat_message(
+        index,
+        msgTypeCode=10,
+        extras=json.dumps(extra),
+        msg="Thank you",
+    )
+
+
+def subscription_message(index: int = 0) -> dict:
+    extra = extras(month=3, tierName="Tier 1", nickname="viewer0", tierNo=1)
+    return chat_message(index, msgTypeCode=11, extras=json.dumps(extra))
+
+
+def system_message(index: int = 0) -> dict:
+    extra = {
+        "description": "{registerNickname} blinded a message of {targetNickname}.",
+        "styleType": 1,
+        "visibleRoles": ["common_user"],
+        "params": {
+            "registerNickname": "manager",
+            "targetNickname": "viewer0",
+            "registerChatProfileJson": json.dumps(profile(1)),
+            "targetChatProfileJson": json.dumps(profile(0)),
+        },
+    }
+    return chat_message(
+        index, msgTypeCode=30, profile="{}", uid="@OPEN", extras=json.dumps(extra)
+    )
+
+
+def notice_message() -> dict:
+    extra = extras(registerProfile=profile(1))
+    message = chat_message(0, extras=json.dumps(extra))
+    return {
+        "serviceId": "game",
+        "channelId": CHAT_CHANNEL_ID,
+        "messageTime": message["msgTime"],
+        "userId": message["uid"],
+        "profile": message["profile"],
+        "content": "pinned message",
+        "messageTypeCode": 1,
+        "extras": message["extras"],
+        "createTime": message["ctime"],
+        "updateTime": message["utime"],
+    }
+
+
+def recent_chat(count: int = 50) -> dict:
+    return {
+        "messageList": [
+            {
+                "serviceId": "game",
+                "channelId": CHAT_CHANNEL_ID,
+                "messageTime": message["msgTime"],
+                "userId": message["uid"],
+                "profile": message["profile"],
+                "content": message["msg"],
+                "messageTypeCode": 1,
+                "messageStatusType": "NORMAL",
+                "extras": message["extras"],
+                "createTime": message["ctime"],
+                "updateTime": message["utime"],
+                "memberCount": 1234,
+            }
+            for message in (chat_message(index, index % 20) for index in range(count))
+        ],
+        "userCount": 1234,
+        "notice": notice_message(),
+    }
+
+
+def blind() -> dict:
+    return {
+        "serviceId": "game",
+        "messageTime": int(time.time() * 1000),
+        "blindType": "CBOTBLIND",
+        "blindUserId": None,
+        "userId": f"{0:032x}",
+        "message": None,
+    }
+
+
+def mission_event() -> dict:
+    data = json.loads(donation_message(0, "MISSION")["extras"])
+    data["type"] = "DONATION_MISSION_IN_PROGRESS"
+    return data
+
+
+def frame(cmd: int, body, tid=None) -> dict:
+    return {
+        "svcid": "game",
+        "ver": "1",
+        "cmd": cmd,
+        "cid": CHAT_CHANNEL_ID,
+        "tid": tid,
+        "bdy": body,
+    }
+
+
+def chat_frame(count: int = 1, start: int = 0) -> dict:
+    return frame(
+        93101, [chat_message(start + index, index % 20) for index in range(count)]
+    )
+
+
+def partial_channel(index: int = 0) -> dict:
+    return {
+        "channelId": f"{index:032x}",
+        "channelName": f"streamer{index}",
+        "channelImageUrl": "https://nng-phinf.pstatic.net/MjAyNDA1MDNfMTk5/channel.png",
+        "verifiedMark": False,
+        "personalData": {"privateUserBlock": False},
+    }
+
+
+def channel(index: int = 0) -> dict:
+    data = partial_channel(index)
+    data.update(
+        channelDescription="Welcome to my channel",
+        followerCount=12345,
+        openLive=True,
+    )
+    return data
+
+
+def live_polling_status() -> str:
+    return json.dumps(
+        {
+            "status": "STARTED",
+            "isPublishing": True,
+            "playableStatus": "PLAYABLE",
+            "trafficThrottling": -1,
+            "callPeriodMilliSecond": 10000,
+        }
+    )
+
+
+def live_status() -> dict:
+    return {
+        "liveTitle": "Playing a game",
+        "status": "OPEN",
+        "concurrentUserCount": 1234,
+        "accumulateCount": 56789,
+        "paidPromotion": False,
+        "adult": False,
+        "chatChannelId": CHAT_CHANNEL_ID,
+        "categoryType": "GAME",
+        "liveCategory": "League_of_Legends",
+        "liveCategoryValue": "League of Legends",
+        "livePollingStatusJson": live_polling_status(),
+        "faultStatus": None,
+        "userAdultStatus": "NOT_LOGIN_USER",
+        "chatActive": True,
+        "chatAvailableGroup": "ALL",
+        "chatAvailableCondition": "NONE",
+        "minFollowerMinute": 0,
+    }
+
+
+def live(index: int = 0) -> dict:
+    return {
+        "liveId": 1000 + index,
+        "liveTitle": f"Playing a game {index}",
+        "liveImageUrl": "https://livecloud-thumb.akamaized.net/live/image_{type}.jpg",
+        "accumulateCount": 56789,
+        "adult": False,
+        "chatChannelId": CHAT_CHANNEL_ID,
+        "categoryType": "GAME",
+        "concurrentUserCount": 1234,
+        "defaultThumbnailImageUrl": None,
+        "liveCategory": "League_of_Legends",
+        "liveCategoryValue": "League of Legends",
+        "openDate": "2024-05-01 12:00:00",
+        "tags": ["Korean", "LoL"],
+        "channelId": f"{index:032x}",
+    }
+
+
+def live_detail() -> dict:
+    data = live()
+    data.pop("channelId")
+    data.update(
+        status="OPEN",
+        livePollingStatusJson=live_polling_status(),
+        closeDate="2024-05-01 18:00:00",
+        chatActive=True,
+        chatAvailableGroup="ALL",
+        chatAvailableCondition="NONE",
+        paidPromotion=False,
+        minFollowerMinute=0,
+        userAdultStatus=None,
+        channel=partial_channel(),
+    )
+    return data
+
+
+def video(index: int = 0) -> dict:
+    return {
+        "adult": False,
+        "categoryType": "GAME",
+        "channel": partial_channel(index),
+        "channelId": f"{index:032x}",
+        "duration": 3600,
+        "publishDate": "2024-05-01 12:00:00",
+        "readCount": 1234,
+        "thumbnailImageUrl": None,
+        "videoCategory": "League_of_Legends",
+        "videoCategoryValue": "League of Legends",
+        "videoId": None,
+        "videoNo": 1000 + index,
+        "videoTitle": f"Replay {index}",
+        "videoType": "REPLAY",
+    }
+
+
+def top_search_result() -> dict:
+    return {
+        "data": [
+            {"channel": channel(0), "live": live(0), "video": None},
+            {"channel": partial_channel(1), "live": None, "video": video(1)},
+            {"channel": channel(2), "live": None, "video": None},
+        ],
+        "size": 3,
+    }
+
+
+def user() -> dict:
+    return {
+        "hasProfile": True,
+        "userIdHash": f"{0:032x}",
+        "nickname": "viewer0",
+        "profileImageUrl": None,
+        "penalties": [],
+        "officialNotiAgree": False,
+        "officialNotiAgreeUpdatedDate": "2024-05-01T12:00:00.000+09",
+        "verifiedMark": False,
+        "loggedIn": True,
+    }
@@ -0,0 +1,42 @@
+"""Measure frames per second of each JSON codec for gateway frames.
+
+$ python benchmarks/json_codec.py --messages 10 --seconds 1
+"""
+
+import argparse
+import json
+
+from chzzkpy.chat import ChatCmd
+from chzzkpy.chat.codec import available_codecs, get_codec
+
+import fixtures
+from timing import measure
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=10, help="messages per frame")
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    inbound = json.dumps(fixtures.chat_frame(args.messages))
+    outbound = {
+        "bdy": {"recentMessageCount": 50},
+        "cmd": ChatCmd.REQUEST_RECENT_CHAT,
+        "sid": "session-id",
+        "cid": fixtures.CHAT_CHANNEL_ID,
+        "tid": 2,
+        "svcid": "game",
+        "ver": "2",
+    }
+
+    print(f"{'codec':<10}{'decode (frames/s)':>20}{'encode (frames/s)':>20}")
+    for name in available_codecs():
+        codec = get_codec(name)
+        decode = measure(lambda: codec.loads(inbound), args.seconds)
+        encode = measure(lambda: codec.dumps(outbound), args.seconds)
+        print(f"{name:<10}{decode:>20,.0f}{encode:>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Measure validation cost of chat and REST models.
+
+$ python benchmarks/models.py --json baseline.json
+$ python benchmarks/models.py --compare baseline.json --threshold 0.1
+
+With `--compare`, the script exits with 1 if ops/s of any model drops more than the threshold.
+"""
+
+import argparse
+import functools
+import json
+import platform
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+import pydantic
+
+from chzzkpy.chat import (
+    Blind,
+    ChatMessage,
+    DonationMessage,
+    MissionDonation,
+    NoticeMessage,
+    RecentChat,
+    SubscriptionMessage,
+    SystemMessage,
+)
+from chzzkpy.live import LiveDetail, LiveStatus
+from chzzkpy.search import TopSearchResult
+from chzzkpy.user import User
+
+import fixtures
+from timing import measure
+
+
+def system_message() -> dict:
+    data = fixtures.system_message()
+    data["profile"] = (
+        None  # ConnectionState replaces an empty profile before validation.
+    )
+    return data
+
+
+CASES: dict[str, tuple[type[pydantic.BaseModel], Callable[[], Any]]] = {
+    "ChatMessage": (ChatMessage, fixtures.chat_message),
+    "DonationMessage[chat]": (DonationMessage, lambda: fixtures.donation_message()),
+    "DonationMessage[video]": (
+        DonationMessage,
+        lambda: fixtures.donation_message(donation_type="VIDEO"),
+    ),
+    "DonationMessage[mission]": (
+        DonationMessage,
+        lambda: fixtures.donation_message(donation_type="MISSION"),
+    ),
+    "SubscriptionMessage": (SubscriptionMessage, fixtures.subscription_message),
+    "SystemMessage": (SystemMessage, system_message),
+    "NoticeMessage": (NoticeMessage, fixtures.notice_message),
+    "RecentChat[50]": (RecentChat, lambda: fixtures.recent_chat(50)),
+    "Blind": (Blind, fixtures.blind),
+    "MissionDonation": (MissionDonation, fixtures.mission_event),
+    "LiveStatus": (LiveStatus, fixtures.live_status),
+    "LiveDetail": (LiveDetail, fixtures.live_detail),
+    "TopSearchResult": (TopSearchResult, fixtures.top_search_result),
+    "User": (User, fixtures.user),
+}
+
+
+def measure_memory(func: Callable[[], Any], repeat: int = 20) -> tuple[int, int]:
+    """Return the peak bytes allocated during a validation, and the bytes retained by the result."""
+    func()  # warm up caches of validators
+    peaks, retained = list(), list()
+    results = list()
+    tracemalloc.start()
+    for _ in range(repeat):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        results.append(func())
+        after, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+        retained.append(after - before)
+    tracemalloc.stop()
+    return min(peaks), min(retained)
+
+
+def run(names: list[str], seconds: float) -> dict[str, dict[str, float]]:
+    results = dict()
+    for name in names:
+        model, fixture = CASES[name]
+        payload = fixture()
+        func = functools.partial(model.model_validate, payload)
+        peak_bytes, retained_bytes = measure_memory(func)
+        results[name] = {
+            "ops": measure(func, seconds, batch=10),
+            "peak_bytes": peak_bytes,
+            "retained_bytes": retained_bytes,
+        }
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    regressions = list()
+    print(f"\n{'model':<26}{'baseline':>14}{'current':>14}{'change':>10}")
+    for name, result in results.items():
+        if name not in baseline.keys():
+            continue
+        base_ops = baseline[name]["ops"]
+        change = result["ops"] / base_ops - 1.0
+        mark = ""
+        if change < -threshold:
+            regressions.append(name)
+            mark = "  REGRESSION"
+        print(
+            f"{name:<26}{base_ops:>14,.0f}{result['ops']:>14,.0f}{change:>+10.1%}{mark}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=0.5, help="seconds per model")
+    parser.add_argument("--filter", default="", help="run models containing the text")
+    parser.add_argument("--json", help="write results to the JSON file")
+    parser.add_argument("--compare", help="compare with results of the JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    names = [name for name in CASES.keys() if args.filter in name]
+    results = run(names, args.seconds)
+
+    print(f"{'model':<26}{'ops/s':>14}{'peak (B)':>12}{'retained (B)':>14}")
+    for name, result in results.items():
+        print(
+            f"{name:<26}{result['ops']:>14,.0f}"
+            f"{result['peak_bytes']:>12,}{result['retained_bytes']:>14,}"
+        )
+
+    if args.json is not None:
+        with open(args.json, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "pydantic": pydantic.VERSION,
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+
+    if args.compare is not None:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if len(regressions) > 0:
+            print(
+                f"\n{len(regressions)} model(s) regressed more than {args.threshold:.0%}"
+            )
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Measure access and dump cost of computed fields of Profile and StreamingProperty, before and after memoization.
+
+$ python benchmarks/profile_fields.py --seconds 1
+"""
+
+import argparse
+import json
+from typing import Optional
+
+from pydantic import computed_field
+
+from chzzkpy.chat import Profile
+from chzzkpy.chat.profile import Badge, StreamingProperty
+
+import fixtures
+from timing import measure
+
+
+class UncachedStreamingProperty(StreamingProperty):
+    """`StreamingProperty` before the badge was memoized."""
+
+    @computed_field
+    @property
+    def donation_ranking_badge(self) -> Optional[Badge]:
+        if (
+            self._real_time_donation_ranking_dt is None
+            or "badge" not in self._real_time_donation_ranking_dt.keys()
+        ):
+            return
+        return Badge.model_validate_json(self._real_time_donation_ranking_dt["badge"])
+
+
+class UncachedProfile(Profile):
+    """`Profile` before the badge was memoized."""
+
+    streaming_property: Optional[UncachedStreamingProperty] = None
+
+    @computed_field
+    @property
+    def badge(self) -> Optional[Badge]:
+        if self._badge is None and self._title is None:
+            return
+        _badge = self._badge or dict()
+        _title = self._title or dict()
+        return Badge.model_validate(
+            {"name": _title.get("name", None), "imageUrl": _badge.get("imageUrl", None)}
+        )
+
+
+def cases(model: type[Profile], raw: str) -> dict:
+    profile = model.model_validate_json(raw)
+
+    def access():
+        profile.badge
+        profile.streaming_property.donation_ranking_badge
+
+    def validate_and_access():
+        new_profile = model.model_validate_json(raw)
+        new_profile.badge
+        new_profile.streaming_property.donation_ranking_badge
+
+    return {
+        "validate": lambda: model.model_validate_json(raw),
+        "access (repeated)": access,
+        "validate + access": validate_and_access,
+        "model_dump": profile.model_dump,
+        "model_dump_json": profile.model_dump_json,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    raw = json.dumps(fixtures.profile())
+    uncached = cases(UncachedProfile, raw)
+    cached = cases(Profile, raw)
+
+    print(f"{'case':<22}{'uncached (ops/s)':>18}{'cached (ops/s)':>18}")
+    for name in cached.keys():
+        before = measure(uncached[name], args.seconds)
+        after = measure(cached[name], args.seconds)
+        print(f"{name:<22}{before:>18,.0f}{after:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Measure parse and dispatch throughput by replaying a recording of gateway frames.
+
+$ python benchmarks/replay.py --recording chat.log.gz
+$ python benchmarks/replay.py --frames 10000 --messages 5
+
+Without `--recording`, a synthetic recording is generated with fixtures.
+A recording of live traffic is made with `ChatClient(..., recorder=FrameRecorder("chat.log.gz"))`.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from chzzkpy.chat import (
+    ChatClient,
+    ChatFrame,
+    FrameRecorder,
+    FrameReplayer,
+    ProfileCache,
+)
+
+import fixtures
+
+
+def generate(path: str, frames: int, messages: int) -> None:
+    received_time = time.time()
+    with FrameRecorder(path) as recorder:
+        for index in range(frames):
+            if index % 50 == 49:
+                body = [fixtures.donation_message(index)]
+                data = fixtures.frame(93102, body)
+            else:
+                data = fixtures.chat_frame(messages, start=index * messages)
+            recorder.record(json.dumps(data), received_time + index * 0.01)
+
+
+async def replay(args, path: str):
+    client = ChatClient(
+        fixtures.STREAMING_CHANNEL_ID,
+        chat_channel_id=fixtures.CHAT_CHANNEL_ID,
+        lazy_parsing=args.lazy,
+        profile_cache=ProfileCache() if args.profile_cache else None,
+        raw_records=args.raw_records,
+        chat_frame=ChatFrame() if args.chat_frame else None,
+    )
+
+    @client.event
+    async def on_record_batch(_):
+        pass
+
+    @client.event
+    async def on_chat(_):
+        pass
+
+    @client.event
+    async def on_donation(_):
+        pass
+
+    result = await FrameReplayer(path).replay(client, speed=args.speed)
+    await client.close()
+    return result, client.chat_frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recording", help="path of recording made by FrameRecorder")
+    parser.add_argument("--frames", type=int, default=10000)
+    parser.add_argument("--messages", type=int, default=5, help="messages per frame")
+    parser.add_argument("--speed", type=float, default=None, help="1.0 is real-time")
+    parser.add_argument("--lazy", action="store_true", help="use lazy parsing")
+    parser.add_argument(
+        "--raw-records", action="store_true", help="dispatch ChatRecord instead"
+    )
+    parser.add_argument(
+        "--profile-cache", action="store_true", help="share profiles of the same user"
+    )
+    parser.add_argument(
+        "--chat-frame", action="store_true", help="accumulate messages to ChatFrame"
+    )
+    args = parser.parse_args()
+
+    path = args.recording
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "chat.log.gz")
+        generate(path, args.frames, args.messages)
+
+    result, frame = asyncio.run(replay(args, path))
+    print(f"frames      {result.frames:>12,}")
+    print(f"messages    {result.messages:>12,}")
+    print(f"messages/s  {result.messages_per_second:>12,.0f}")
+    print(f"p50 (us)    {result.p50 * 1e6:>12,.1f}")
+    print(f"p99 (us)    {result.p99 * 1e6:>12,.1f}")
+
+    if frame is not None:
+        started_at = time.perf_counter()
+        frame.rate_histogram(interval=1000)
+        frame.top_users(10)
+        frame.rolling_sum(60000, interval=1000)
+        elapsed = time.perf_counter() - started_at
+        print(f"frame rows  {len(frame):>12,}")
+        print(f"query (ms)  {elapsed * 1e3:>12,.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure routing of gateway frames: resolving the command code and calling the hook.
+
+$ python benchmarks/routing.py --seconds 1
+"""
+
+import argparse
+import asyncio
+import json
+from enum import Enum
+from typing import Any
+
+from chzzkpy.chat import ChatCmd, ChatType
+from chzzkpy.chat.enums import get_enum
+from chzzkpy.chat.gateway import ChzzkWebSocket
+
+import fixtures
+from timing import measure, measure_async
+
+
+def scan_enum(cls: type[Enum], val: Any):
+    """The linear scan of `get_enum` before it used the index of values."""
+    enum_val = [i for i in cls if i.value == val]
+    if len(enum_val) == 0:
+        return val
+    return enum_val[0]
+
+
+async def route(seconds: float) -> float:
+    websocket = ChzzkWebSocket(socket=None, loop=asyncio.get_running_loop())
+    for cmd in ChatCmd:
+        websocket.set_hook(cmd, lambda _: None)
+
+    frames = [
+        fixtures.chat_frame(1),
+        fixtures.frame(ChatCmd.SPECIAL_CHAT, [fixtures.donation_message()]),
+        fixtures.frame(ChatCmd.BLIND, fixtures.blind()),
+        fixtures.frame(12345, None),  # unknown command
+    ]
+    frames = [json.loads(json.dumps(frame)) for frame in frames]
+    index = 0
+
+    async def received_message():
+        nonlocal index
+        index = (index + 1) % len(frames)
+        await websocket.received_message(frames[index])
+
+    return await measure_async(received_message, seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    cases = {
+        "ChatCmd (last member)": (ChatCmd, ChatCmd.SEND_CHAT.value),
+        "ChatCmd (unknown)": (ChatCmd, 12345),
+        "ChatType (last member)": (ChatType, ChatType.OPEN.value),
+    }
+    print(f"{'lookup':<26}{'scan (ops/s)':>16}{'index (ops/s)':>16}")
+    for name, (cls, value) in cases.items():
+        scan = measure(lambda: scan_enum(cls, value), args.seconds)
+        index = measure(lambda: get_enum(cls, value), args.seconds)
+        print(f"{name:<26}{scan:>16,.0f}{index:>16,.0f}")
+
+    frames = asyncio.run(route(args.seconds))
+    print(f"\nreceived_message: {frames:,.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
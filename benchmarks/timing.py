@@ -0,0 +1,30 @@
+"""Timing helpers shared by benchmarks."""
+
+import time
+from typing import Any, Awaitable, Callable
+
+
+def measure(func: Callable[[], Any], seconds: float, batch: int = 100) -> float:
+    """Return the number of calls per second, calling `func` in batches for `seconds`."""
+    count = 0
+    started_at = time.perf_counter()
+    deadline = started_at + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(batch):
+            func()
+        count += batch
+    return count / (time.perf_counter() - started_at)
+
+
+async def measure_async(
+    func: Callable[[], Awaitable[Any]], seconds: float, batch: int = 100
+) -> float:
+    """Return the number of awaited calls per second, awaiting `func` in batches for `seconds`."""
+    count = 0
+    started_at = time.perf_counter()
+    deadline = started_at + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(batch):
+            await func()
+        count += batch
+    return count / (time.perf_counter() - started_at)
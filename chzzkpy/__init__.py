@@ -24,8 +24,11 @@ SOFTWARE.
 from typing import NamedTuple, Literal, Optional
 
 from .client import Client
+from .connection_pool import ConnectionPool
 from .error import *
 from .live import LiveStatus, LiveDetail, LivePollingStatus
+from .poller import LivePoller
+from .response_cache import ResponseCache
 from .user import User
 
 # Extension Package
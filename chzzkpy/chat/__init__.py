@@ -22,8 +22,11 @@ SOFTWARE.
 """
 
 from .blind import Blind
+from .cache import MessageCache
 from .chat_client import ChatClient
+from .codec import JSONCodec, OrjsonCodec, MsgspecCodec, get_codec
 from .connected import ConnectedInfo
+from .dedup import MessageDeduplicator
 from .donation import (
     DonationRank,
     BaseDonation,
@@ -31,8 +34,12 @@ from .donation import (
     VideoDonation,
     MissionDonation,
 )
-from .enums import ChatType, ChatCmd, UserRole
+from .enums import ChatType, ChatCmd, UserRole, EventPriority
 from .error import *
+from .executor import EventExecutor
+from .fake_server import FakeChatServer
+from .frame import ChatFrame
+from .hub import ChatHub, HubChatClient
 from .message import (
     Message,
     MessageDetail,
@@ -41,7 +48,13 @@ from .message import (
     DonationMessage,
     SubscriptionMessage,
     SystemMessage,
+    ImageMessage,
+    StickerMessage,
+    VideoMessage,
+    RichMessage,
+    OpenMessage,
     Extra,
+    MediaExtra,
     ChatDonationExtra,
     VideoDonationExtra,
     MissionDonationExtra,
@@ -51,4 +64,11 @@ from .message import (
     SystemExtra,
 )
 from .profile import Profile, ActivityBadge, StreamingProperty, Badge
+from .profile_cache import ProfileCache
+from .reconnect import ReconnectPolicy
+from .registry import MessageType, register_message_type, get_message_type
+from .record import ChatRecord
+from .recorder import FrameRecorder, FrameReplayer, ReplayResult
 from .recent_chat import RecentChat
+from .sender import ChatSender, TokenBucket
+from .shedding import LoadSheddingPolicy, get_event_priority
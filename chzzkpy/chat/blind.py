@@ -21,12 +21,17 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from __future__ import annotations
+
 import datetime
-from typing import Optional
-from pydantic import Field
+from typing import Optional, TYPE_CHECKING
+from pydantic import Field, PrivateAttr
 
 from ..base_model import ChzzkModel
 
+if TYPE_CHECKING:
+    from .message import Message
+
 
 class Blind(ChzzkModel):
     service_id: str
@@ -35,3 +40,11 @@ class Blind(ChzzkModel):
     blind_user_id: Optional[str]
     user_id: str
     message: Optional[str]
+
+    _cached_message: Optional[Message] = PrivateAttr(default=None)
+
+    @property
+    def cached_message(self) -> Optional[Message]:
+        """The blinded message found in the message cache of client.
+        If the message cache is disabled or the message is evicted, returns None."""
+        return self._cached_message
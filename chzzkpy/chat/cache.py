@@ -0,0 +1,265 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+import itertools
+import sys
+from collections import OrderedDict
+from typing import Any, Iterator, Literal, Optional
+
+from pydantic import BaseModel
+
+from .message import Message
+
+
+def _size_of(value: Any) -> int:
+    """The approximate memory in bytes of a value, with the fields of models and items of containers."""
+    size = sys.getsizeof(value)
+    if isinstance(value, BaseModel):
+        size += _size_of(value.__dict__)
+        if value.__pydantic_extra__:
+            size += _size_of(value.__pydantic_extra__)
+    elif isinstance(value, dict):
+        size += sum(_size_of(item) for item in value.values())
+    elif isinstance(value, (list, tuple)):
+        size += sum(_size_of(item) for item in value)
+    return size
+
+
+class MessageCache:
+    """Represents a bounded cache of received messages with indexes by user and by time.
+
+    Parameters
+    ----------
+    max_messages : int
+        The maximum number of cached messages, by default 1000
+    max_memory : Optional[int]
+        If it is set, messages are evicted while the approximate memory in bytes exceeds it.
+        The memory of a message is measured with `sys.getsizeof` on its fields and nested models.
+        A profile shared by :class:`ProfileCache` is counted for each message.
+    eviction : Literal["oldest", "busiest_user"]
+        The policy to choose a message to evict, by default "oldest"
+
+        * `oldest`: The oldest received message is evicted, like a ring buffer.
+        * `busiest_user`: The oldest message of the user who has the most cached messages is evicted.
+          A few users who flood the chat don't evict the messages of others.
+    """
+
+    def __init__(
+        self,
+        max_messages: int = 1000,
+        max_memory: Optional[int] = None,
+        eviction: Literal["oldest", "busiest_user"] = "oldest",
+    ):
+        if max_messages < 1:
+            raise ValueError("max_messages must be greater than 0.")
+        if eviction not in ("oldest", "busiest_user"):
+            raise ValueError(f"Unknown eviction policy: {eviction}")
+
+        self.max_messages = max_messages
+        self.max_memory = max_memory
+        self.eviction = eviction
+
+        self.evicted: int = 0
+        self.memory_usage: int = 0
+
+        self._messages: OrderedDict[tuple[str, datetime.datetime], Message] = (
+            OrderedDict()
+        )
+        self._sizes: dict[tuple[str, datetime.datetime], int] = dict()
+        self._by_user: dict[str, dict[tuple[str, datetime.datetime], None]] = dict()
+        # Users grouped by the number of cached messages, to find the busiest user in O(1).
+        self._users_by_count: dict[int, dict[str, None]] = dict()
+        self._max_count: int = 0
+
+        # Messages arrive almost in order of time, so the index is appended at the end,
+        # and it is sorted only when a message arrived out of order and the index is searched.
+        # Removed messages are skipped from the head and compacted later. (lazy deletion)
+        self._by_time: list[
+            tuple[datetime.datetime, int, tuple[str, datetime.datetime]]
+        ] = list()
+        self._by_time_head: int = 0
+        self._by_time_sorted: bool = True
+        self._sequences: dict[tuple[str, datetime.datetime], int] = dict()
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(list(self._messages.values()))
+
+    @staticmethod
+    def _key(user_id: str, time: datetime.datetime) -> tuple[str, datetime.datetime]:
+        return user_id, time
+
+    def add(self, message: Message) -> None:
+        """Put a message into the cache, and evict messages over the limit."""
+        key = self._key(message.user_id, message.time)
+        size = _size_of(message)
+        if key in self._messages.keys():
+            self.memory_usage += size - self._sizes[key]
+            self._sizes[key] = size
+            self._messages[key] = message
+        else:
+            self._insert(key, message, size)
+
+        while len(self._messages) > self.max_messages or (
+            self.max_memory is not None
+            and self.memory_usage > self.max_memory
+            and len(self._messages) > 1
+        ):
+            self._remove(self._evicting_key())
+            self.evicted += 1
+
+    def _insert(
+        self, key: tuple[str, datetime.datetime], message: Message, size: int
+    ) -> None:
+        sequence = next(self._sequence)
+        self._messages[key] = message
+        self._sizes[key] = size
+        self._sequences[key] = sequence
+        self.memory_usage += size
+
+        user_keys = self._by_user.setdefault(message.user_id, dict())
+        user_keys[key] = None
+        self._move_user(message.user_id, len(user_keys) - 1, len(user_keys))
+
+        entry = (message.time, sequence, key)
+        if len(self._by_time) > 0 and entry < self._by_time[-1]:
+            self._by_time_sorted = False
+        self._by_time.append(entry)
+
+    def _move_user(self, user_id: str, before: int, after: int) -> None:
+        if before > 0:
+            users = self._users_by_count[before]
+            users.pop(user_id)
+            if len(users) == 0:
+                self._users_by_count.pop(before)
+                if self._max_count == before:
+                    self._max_count = after
+        if after > 0:
+            self._users_by_count.setdefault(after, dict())[user_id] = None
+            self._max_count = max(self._max_count, after)
+
+    def _evicting_key(self) -> tuple[str, datetime.datetime]:
+        if self.eviction == "busiest_user":
+            user_id = next(iter(self._users_by_count[self._max_count]))
+            return next(iter(self._by_user[user_id]))
+        return next(iter(self._messages))
+
+    def _remove(self, key: tuple[str, datetime.datetime]) -> Message:
+        message = self._messages.pop(key)
+        self.memory_usage -= self._sizes.pop(key)
+        self._sequences.pop(key)
+
+        user_keys = self._by_user[message.user_id]
+        user_keys.pop(key)
+        self._move_user(message.user_id, len(user_keys) + 1, len(user_keys))
+        if len(user_keys) == 0:
+            self._by_user.pop(message.user_id)
+
+        while self._by_time_head < len(self._by_time) and not self._is_cached(
+            self._by_time[self._by_time_head]
+        ):
+            self._by_time_head += 1
+        if len(self._by_time) > 2 * len(self._messages) + 16:
+            self._compact_by_time()
+        return message
+
+    def _is_cached(
+        self, entry: tuple[datetime.datetime, int, tuple[str, datetime.datetime]]
+    ) -> bool:
+        _, sequence, key = entry
+        return self._sequences.get(key) == sequence
+
+    def _compact_by_time(self) -> None:
+        self._by_time = [
+            entry
+            for entry in itertools.islice(self._by_time, self._by_time_head, None)
+            if self._is_cached(entry)
+        ]
+        self._by_time_head = 0
+        if not self._by_time_sorted:
+            # The index is almost sorted, so it is sorted in about linear time. (Timsort)
+            self._by_time.sort()
+            self._by_time_sorted = True
+
+    def get(self, user_id: str, time: datetime.datetime) -> Optional[Message]:
+        """Get the message of the user sent at the time.
+
+        Parameters
+        ----------
+        user_id : str
+            The user ID hash of sender.
+        time : datetime.datetime
+            The time that the message is sent. (ex. :attr:`Blind.time`)
+        """
+        return self._messages.get(self._key(user_id, time))
+
+    def messages_by(self, user_id: str) -> list[Message]:
+        """Get the cached messages of the user, in order of received.
+
+        Parameters
+        ----------
+        user_id : str
+            The user ID hash of sender.
+        """
+        return [self._messages[key] for key in self._by_user.get(user_id, dict())]
+
+    def messages_between(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> list[Message]:
+        """Get the cached messages sent from `start` to `end` (inclusive), in order of time.
+
+        Parameters
+        ----------
+        start : datetime.datetime
+            The start time.
+        end : datetime.datetime
+            The end time.
+        """
+        if not self._by_time_sorted:
+            self._compact_by_time()
+        low = bisect.bisect_left(self._by_time, (start,), lo=self._by_time_head)
+        high = bisect.bisect_left(self._by_time, (end, sys.maxsize), lo=low)
+        return [
+            self._messages[entry[2]]
+            for entry in itertools.islice(self._by_time, low, high)
+            if self._is_cached(entry)
+        ]
+
+    def clear(self) -> None:
+        self._messages.clear()
+        self._sizes.clear()
+        self._sequences.clear()
+        self._by_user.clear()
+        self._users_by_count.clear()
+        self._max_count = 0
+        self._by_time.clear()
+        self._by_time_head = 0
+        self._by_time_sorted = True
+        self.memory_usage = 0
@@ -24,23 +24,39 @@ SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import math
+import time
 from typing import Any, Optional, Callable, Coroutine, TYPE_CHECKING
 
 import aiohttp
 
-from .enums import ChatCmd
+from .cache import MessageCache
+from .codec import JSONCodec, get_codec
+from .dedup import MessageDeduplicator
+from .enums import ChatCmd, ChatType
 from .error import ChatConnectFailed
+from .executor import EventExecutor
+from .frame import ChatFrame
+from .shedding import LoadSheddingPolicy, get_event_priority
 from .gateway import ChzzkWebSocket, ReconnectWebsocket
 from .http import ChzzkChatSession
+from .profile_cache import ProfileCache
+from .reconnect import ReconnectPolicy
+from .recorder import FrameRecorder
+from .registry import MessageType
+from .sender import ChatSender, TokenBucket
 from .state import ConnectionState
 from ..client import Client
+from ..connection_pool import ConnectionPool
 from ..error import LoginRequired
 from ..http import ChzzkAPISession
+from ..response_cache import ResponseCache
 
 if TYPE_CHECKING:
     from .access_token import AccessToken
-    from .message import ChatMessage
+    from .message import ChatMessage, Message
     from .recent_chat import RecentChat
 
 _log = logging.getLogger(__name__)
@@ -49,6 +65,65 @@ _log = logging.getLogger(__name__)
 class ChatClient(Client):
     """Represents a client to connect Chzzk (Naver Live Streaming).
     Addition, this class includes chat feature.
+
+    Parameters
+    ----------
+    channel_id : str
+        The channel ID of broadcaster
+    authorization_key : Optional[str]
+        A `NID_AUT` value in the cookie.
+    session_key : Optional[str]
+        A `NID_SES` value in the cookie.
+    chat_channel_id : Optional[str]
+        The chat channel ID. If it is empty, it is fetched with `live_status` method.
+    loop : Optional[asyncio.AbstractEventLoop]
+        The event loop to use.
+    codec : Optional[JSONCodec]
+        The codec to (de)serialize gateway frames. By default, the fastest installed codec.
+    lazy_parsing : bool
+        If it is true, the `profile` and `extras` of received messages are validated
+        when they are accessed first. It reduces the cost of messages that are partially read.
+        Comparing, printing or dumping a message validates them, so it behaves the same as an eager message.
+    event_executor : Optional[EventExecutor]
+        The executor that runs event handlers with bounded queues.
+        If it is empty, a task is created for each event handler.
+    load_shedding : Optional[LoadSheddingPolicy]
+        The policy to shed events of low priority (ex. chat) when event handlers fall behind.
+    reconnect_policy : Optional[ReconnectPolicy]
+        The policy to reconnect the websocket. By default, :class:`ReconnectPolicy` with default values.
+    heartbeat_interval : Optional[float]
+        The interval in seconds to send PING for measuring latency and detecting a dead connection,
+        by default 5.0. If it is None, the heartbeat is disabled.
+    max_missed_heartbeats : int
+        The number of missed PONG to consider the connection dead and reconnect quickly, by default 2
+    send_rate_limit : Optional[TokenBucket]
+        The token bucket to limit the rate of :meth:`send_chat`. By default, 1 chat per second with bursts of 3.
+    send_timeout : float
+        The time in seconds to wait for the server to echo a sent chat, by default 10.0
+    recorder : Optional[FrameRecorder]
+        The recorder to save raw frames of the websocket. The recording can be replayed with :class:`FrameReplayer`.
+    chat_server_url : Optional[str]
+        The URL of chat server to connect instead of Chzzk. (ex. :class:`FakeChatServer` for testing)
+    deduplicator : Optional[MessageDeduplicator]
+        If it is set, a message received again (ex. with recent chats after reconnecting) is not dispatched.
+    message_cache : Optional[MessageCache]
+        If it is set, received messages are cached to look up by user or time,
+        and :class:`Blind` is resolved to the blinded message.
+    profile_cache : Optional[ProfileCache]
+        If it is set, the profiles of the same raw JSON are validated once and shared between messages.
+    raw_records : bool
+        If it is true, messages are not validated, and :class:`ChatRecord` is dispatched
+        to `on_record` and `on_record_batch` instead of the events of messages. (ex. `on_chat`)
+        The echo of a chat sent with :meth:`send_chat` is still validated to resolve its future.
+    chat_frame : Optional[ChatFrame]
+        If it is set, received messages are accumulated to the columns of frame for analytics.
+        It requires the `numpy` package.
+    response_cache : Optional[ResponseCache]
+        If it is set, the responses of `live_status` and `live_detail` are cached
+        for the polling period that the server advises.
+    connection_pool : Optional[ConnectionPool]
+        The pool of connections shared by the REST sessions and the websocket session.
+        Pass the same pool to many clients to share connections, the DNS cache and the keep-alive pool.
     """
 
     def __init__(
@@ -58,36 +133,86 @@ class ChatClient(Client):
         session_key: Optional[str] = None,
         chat_channel_id: Optional[str] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        codec: Optional[JSONCodec] = None,
+        lazy_parsing: bool = False,
+        event_executor: Optional[EventExecutor] = None,
+        load_shedding: Optional[LoadSheddingPolicy] = None,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        heartbeat_interval: Optional[float] = 5.0,
+        max_missed_heartbeats: int = 2,
+        send_rate_limit: Optional[TokenBucket] = None,
+        send_timeout: float = 10.0,
+        recorder: Optional[FrameRecorder] = None,
+        chat_server_url: Optional[str] = None,
+        deduplicator: Optional[MessageDeduplicator] = None,
+        message_cache: Optional[MessageCache] = None,
+        profile_cache: Optional[ProfileCache] = None,
+        raw_records: bool = False,
+        chat_frame: Optional[ChatFrame] = None,
+        response_cache: Optional[ResponseCache] = None,
+        connection_pool: Optional[ConnectionPool] = None,
     ):
         super().__init__(
-            loop=loop, authorization_key=authorization_key, session_key=session_key
+            loop=loop,
+            authorization_key=authorization_key,
+            session_key=session_key,
+            response_cache=response_cache,
+            connection_pool=connection_pool,
         )
 
+        self.codec: JSONCodec = codec or get_codec()
         self.chat_channel_id: str = chat_channel_id
         self.channel_id: str = channel_id
         self.access_token: Optional[AccessToken] = None
         self.user_id: Optional[str] = None
 
-        self.ws_session = aiohttp.ClientSession(loop=self.loop)
-
         self._listeners: dict[str, list[tuple[asyncio.Future, Callable[..., bool]]]] = (
             dict()
         )
         self._extra_event: dict[str, list[Callable[..., Coroutine[Any, Any, Any]]]] = (
             dict()
         )
+        self._observed_events: set[str] = set()
+        self._executor: Optional[EventExecutor] = event_executor
+        self._tasks: set[asyncio.Task] = set()
+        self.load_shedding: Optional[LoadSheddingPolicy] = load_shedding
 
         self._ready = asyncio.Event()
 
-        handler = {ChatCmd.CONNECTED: self._ready.set}
+        self.reconnect_policy: ReconnectPolicy = reconnect_policy or ReconnectPolicy()
+        self.reconnect_count: int = 0
+        self.disconnected_time: float = 0.0
+        self._disconnected_at: Optional[float] = None
+
+        self.heartbeat_interval: Optional[float] = heartbeat_interval
+        self.max_missed_heartbeats: int = max_missed_heartbeats
+
+        self.sender: ChatSender = ChatSender(
+            self, rate_limit=send_rate_limit, timeout=send_timeout
+        )
+        self.recorder: Optional[FrameRecorder] = recorder
+        self.chat_server_url: Optional[str] = chat_server_url
+
+        handler = {ChatCmd.CONNECTED: self._on_connected}
         self._connection = ConnectionState(
-            dispatch=self.dispatch, handler=handler, client=self
+            dispatch=self.dispatch,
+            handler=handler,
+            client=self,
+            lazy_parsing=lazy_parsing,
+            is_observed=self.is_observed,
+            deduplicator=deduplicator,
+            message_cache=message_cache,
+            profile_cache=profile_cache,
+            raw_records=raw_records,
+            chat_frame=chat_frame,
         )
         self._gateway: Optional[ChzzkWebSocket] = None
 
     def _session_initial_set(self):
-        self._api_session = ChzzkAPISession(loop=self.loop)
-        self._game_session = ChzzkChatSession(loop=self.loop)
+        session_options = self.connection_pool.session_options(self.loop)
+        self._api_session = ChzzkAPISession(loop=self.loop, **session_options)
+        self._game_session = ChzzkChatSession(loop=self.loop, **session_options)
+        self.ws_session = aiohttp.ClientSession(loop=self.loop, **session_options)
 
     @property
     def is_connected(self) -> bool:
@@ -116,7 +241,7 @@ class ChatClient(Client):
                 raise ChatConnectFailed(self.channel_id)
             self.chat_channel_id = status.chat_channel_id
 
-        if self._game_session.has_login:
+        if self._game_session.has_login and self.user_id is None:
             user = await self.user()
             self.user_id = user.user_id_hash
 
@@ -127,36 +252,117 @@ class ChatClient(Client):
 
     async def close(self):
         """Close the connection to chzzk."""
+        await self._close_connection()
+        if self._executor is not None:
+            await self._executor.close()
+        await self.ws_session.close()
+        await super().close()
+
+    async def _close_connection(self) -> None:
         self._ready.clear()
 
+        self.sender.close()
         if self._gateway is not None:
+            self._gateway.stop_heartbeat()
             await self._gateway.socket.close()
-        await self.ws_session.close()
-        await super().close()
+        if self.recorder is not None:
+            self.recorder.close()
 
     async def polling(self) -> None:
         session_id: Optional[str] = None
+        attempts = 0
+        refresh_token = False
         while not self.is_closed:
             try:
-                self._gateway = await ChzzkWebSocket.from_client(
-                    self, self._connection, session_id=session_id
+                if refresh_token:
+                    await self._generate_access_token()
+                    refresh_token = False
+
+                self._gateway = await self._create_gateway(session_id=session_id)
+                await self._gateway.send_open(
+                    access_token=self.access_token.access_token,
+                    chat_channel_id=self.chat_channel_id,
+                    mode="READ" if self.user_id is None else "SEND",
+                    user_id=self.user_id,
                 )
 
-                # Initial Connection
-                if session_id is None:
-                    await self._gateway.send_open(
-                        access_token=self.access_token.access_token,
-                        chat_channel_id=self.chat_channel_id,
-                        mode="READ" if self.user_id is None else "SEND",
-                        user_id=self.user_id,
-                    )
-                    session_id = self._gateway.session_id
-
                 while True:
                     await self._gateway.poll_event()
-            except ReconnectWebsocket:
-                self.dispatch("disconnect")
-                continue
+                    if self._executor is not None and self._executor.is_blocked:
+                        # Backpressure: Stop reading until handlers catch up.
+                        # PONG is not read while waiting, so the heartbeat is paused.
+                        self._gateway.pause_heartbeat()
+                        try:
+                            await self._executor.wait_for_capacity()
+                        finally:
+                            self._gateway.resume_heartbeat()
+            except (ReconnectWebsocket, aiohttp.ClientError, asyncio.TimeoutError):
+                if self.is_closed:
+                    return
+
+                if self.is_connected:
+                    attempts = 0
+                    session_id = self._gateway.session_id
+                else:
+                    # The access token may be expired, if the connection failed before CONNECTED.
+                    refresh_token = True
+
+                self._ready.clear()
+                if self._disconnected_at is None:
+                    self._disconnected_at = time.monotonic()
+                    self.dispatch("disconnect")
+
+                attempts += 1
+                if not self.reconnect_policy.can_retry(attempts):
+                    raise
+
+                delay = self.reconnect_policy.delay(attempts)
+                _log.info("Reconnecting in %.2f seconds (attempt %d)", delay, attempts)
+                await asyncio.sleep(delay)
+
+    def _on_connected(self) -> None:
+        self._ready.set()
+
+        if self._disconnected_at is None:
+            self._connection.mark_received_until(int(time.time() * 1000))
+            return
+
+        self.reconnect_count += 1
+        self.disconnected_time += time.monotonic() - self._disconnected_at
+        self._disconnected_at = None
+
+        # Recover messages missed while reconnecting.
+        if self.reconnect_policy.backfill_count > 0:
+            self._connection.backfill_pending = True
+            task = self.loop.create_task(
+                self.request_recent_chat(self.reconnect_policy.backfill_count)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @property
+    def reconnect_metrics(self) -> dict[str, int | float]:
+        """The metrics of reconnection. (reconnect_count, disconnected_time, backfilled_messages)"""
+        disconnected_time = self.disconnected_time
+        if self._disconnected_at is not None:
+            disconnected_time += time.monotonic() - self._disconnected_at
+        return {
+            "reconnect_count": self.reconnect_count,
+            "disconnected_time": disconnected_time,
+            "backfilled_messages": self._connection.backfilled_messages,
+        }
+
+    @property
+    def latency(self) -> float:
+        """The latency in seconds of the latest heartbeat. If it is not measured, returns `inf`."""
+        if self._gateway is None:
+            return math.inf
+        return self._gateway.latency
+
+    async def _create_gateway(self, session_id: Optional[str] = None) -> ChzzkWebSocket:
+        return await ChzzkWebSocket.from_client(
+            self, self._connection, session_id=session_id
+        )
 
     # Event Handler
     async def wait_until_connected(self) -> None:
@@ -197,6 +403,10 @@ class ChatClient(Client):
         if event_name not in self._listeners.keys():
             self._listeners[event_name] = list()
         self._listeners[event_name].append((future, check))
+        self._refresh_observed(event_name)
+
+        # A future cancelled by timeout is removed from listeners.
+        future.add_done_callback(lambda _: self._prune_listeners(event_name))
         return asyncio.wait_for(future, timeout=timeout)
 
     def event(
@@ -208,8 +418,13 @@ class ChatClient(Client):
 
         A list of events that the client can listen to.
         * `on_chat`: Called when a ChatMessage is created and sent.
+        * `on_image` / `on_sticker` / `on_video` / `on_rich`: Called when a chat of the media type is sent.
+        * `on_open`: Called when a message of OPEN type is sent.
+        * `on_record` / `on_record_batch`: Called with :class:`ChatRecord`, if `raw_records` is enabled.
         * `on_connect`: Called when the client is done preparing the data received from Chzzk.
         * `on_donation`: Called when a listener donates
+        * `on_chat_batch` / `on_donation_batch` / `on_subscription_batch` / `on_system_message_batch`:
+                            Called once per received frame with a list of the messages.
         * `on_system_message`: Called when a system message is created and sent.
                             (Example. notice/blind message)
         * `on_recent_chat`: Called when a recent chat received.
@@ -217,6 +432,7 @@ class ChatClient(Client):
         * `on_pin` / `on_unpin`: Called when a message pinned or unpinned.
         * `on_blind`: Called when a message blocked.
         * `on_client_error`: Called when client cause exception.
+        * `on_shed`: Called when events are shed by `load_shedding` policy.
 
         Example
         -------
@@ -228,22 +444,115 @@ class ChatClient(Client):
             raise TypeError("function must be a coroutine.")
 
         event_name = coro.__name__
-        if event_name not in self._listeners.keys():
+        if event_name not in self._extra_event.keys():
             self._extra_event[event_name] = list()
         self._extra_event[event_name].append(coro)
+        self._refresh_observed(event_name.removeprefix("on_"))
         return coro
 
+    def remove_event(self, coro: Callable[..., Coroutine[Any, Any, Any]]) -> None:
+        """Remove an event handler registered with :meth:`event`.
+
+        Parameters
+        ----------
+        coro : Callable[..., Coroutine[Any, Any, Any]]
+            The event handler to remove.
+        """
+        event_name = coro.__name__
+        if coro not in self._extra_event.get(event_name, list()):
+            return
+
+        self._extra_event[event_name].remove(coro)
+        if len(self._extra_event[event_name]) == 0:
+            self._extra_event.pop(event_name)
+        self._refresh_observed(event_name.removeprefix("on_"))
+
+    def is_observed(self, event: str) -> bool:
+        """Check whether an event handler or a :meth:`wait_for` listener waits for the event.
+        The messages of events that no one observes are not parsed.
+
+        Parameters
+        ----------
+        event : str
+            The event name without `on_` prefix. (ex. `chat`)
+        """
+        if event == "chat" and (self.sender.pending > 0 or self.sender.queue_depth > 0):
+            # The echo of sent chats is needed to resolve the futures of `send_chat`.
+            return True
+        return event in self._observed_events
+
+    def register_message_type(
+        self, type_code: ChatType | int, model: type[Message], event: str
+    ) -> None:
+        """Register a model and an event for the type code of messages received by this client.
+        It overrides the default (:func:`register_message_type`) without changing other clients.
+
+        Parameters
+        ----------
+        type_code : ChatType | int
+            The `msgTypeCode` of messages.
+        model : type[Message]
+            The model to validate messages.
+        event : str
+            The event name without `on_` prefix. (ex. `chat`)
+            Messages are dispatched to `on_{event}` and `on_{event}_batch`.
+        """
+        self._connection.message_types[type_code] = MessageType(model, event)
+
+    @property
+    def message_cache(self) -> Optional[MessageCache]:
+        """The cache of received messages."""
+        return self._connection.message_cache
+
+    @property
+    def chat_frame(self) -> Optional[ChatFrame]:
+        """The columnar frame of received messages."""
+        return self._connection.chat_frame
+
+    @property
+    def skipped_messages(self) -> dict[str, int]:
+        """The number of messages skipped without parsing, because no one observed the event."""
+        return dict(self._connection.skipped_messages)
+
+    def _refresh_observed(self, event: str) -> None:
+        has_handler = len(self._extra_event.get("on_" + event, list())) > 0
+        has_listener = any(
+            not future.done() for future, _ in self._listeners.get(event, list())
+        )
+        if has_handler or has_listener:
+            self._observed_events.add(event)
+        else:
+            self._observed_events.discard(event)
+
+    def _prune_listeners(self, event: str) -> None:
+        if event not in self._listeners.keys():
+            return
+
+        listeners = [
+            (future, condition)
+            for future, condition in self._listeners[event]
+            if not future.done()
+        ]
+        if len(listeners) == 0:
+            self._listeners.pop(event)
+        else:
+            self._listeners[event] = listeners
+        self._refresh_observed(event)
+
     def dispatch(self, event: str, *args: Any, **kwargs) -> None:
         _log.debug("Dispatching event %s", event)
         method = "on_" + event
 
+        if event == "chat":
+            self.sender.acknowledge(args[0])
+
         # wait-for listeners
         if event in self._listeners.keys():
             listeners = self._listeners[event]
             _new_listeners = []
 
             for index, (future, condition) in enumerate(listeners):
-                if future.cancelled():
+                if future.done():
                     continue
 
                 try:
@@ -259,9 +568,19 @@ class ChatClient(Client):
                             future.set_result(args[0])
                         case _:
                             future.set_result(args)
+                    continue
 
                 _new_listeners.append((future, condition))
             self._listeners[event] = _new_listeners
+            self._prune_listeners(event)
+
+        if self.load_shedding is not None and self._shed(event):
+            return
+
+        self._dispatch_handlers(event, *args, **kwargs)
+
+    def _dispatch_handlers(self, event: str, *args: Any, **kwargs) -> None:
+        method = "on_" + event
 
         # event-listener
         if method not in self._extra_event.keys():
@@ -270,6 +589,23 @@ class ChatClient(Client):
         for coroutine_function in self._extra_event[method]:
             self._schedule_event(coroutine_function, method, *args, **kwargs)
 
+    @property
+    def backlog(self) -> int:
+        """The number of pending event handlers."""
+        if self._executor is not None:
+            return self._executor.queue_depth
+        return len(self._tasks)
+
+    def _shed(self, event: str) -> bool:
+        if not self.load_shedding.should_shed(event, self.backlog):
+            return False
+
+        report = self.load_shedding.pop_report()
+        if report is not None:
+            _log.warning("Shedding events because of backlog: %s", report)
+            self.dispatch("shed", report)
+        return True
+
     async def _run_event(
         self,
         coro: Callable[..., Coroutine[Any, Any, Any]],
@@ -294,10 +630,41 @@ class ChatClient(Client):
         event_name: str,
         *args: Any,
         **kwargs: Any,
-    ) -> asyncio.Task:
+    ) -> Optional[asyncio.Task]:
+        if self._executor is not None:
+            self._executor.start(self.loop)
+            callback = functools.partial(
+                self._run_event, coro, event_name, *args, **kwargs
+            )
+            self._executor.submit(
+                callback,
+                key=self._ordering_key(event_name, args),
+                priority=get_event_priority(event_name.removeprefix("on_")),
+            )
+            return
+
         wrapped = self._run_event(coro, event_name, *args, **kwargs)
         # Schedules the task
-        return self.loop.create_task(wrapped, name=f"chzzk.py: {event_name}")
+        task = self.loop.create_task(wrapped, name=f"chzzk.py: {event_name}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _ordering_key(self, event_name: str, args: tuple[Any, ...]) -> Optional[str]:
+        match self._executor.ordering:
+            case "event":
+                return event_name
+            case "user":
+                for argument in args:
+                    user_id = getattr(argument, "user_id", None)
+                    if user_id is not None:
+                        return user_id
+        return None
+
+    @property
+    def event_executor(self) -> Optional[EventExecutor]:
+        """The executor that runs event handlers."""
+        return self._executor
 
     # API Method
     async def _generate_access_token(self) -> AccessToken:
@@ -308,18 +675,30 @@ class ChatClient(Client):
         return self.access_token
 
     # Chat Method
-    async def send_chat(self, message: str) -> None:
+    async def send_chat(self, message: str) -> asyncio.Future[ChatMessage]:
         """Send a message.
+        The message is put into the outbound queue, and it is sent within the rate limit.
 
         Parameters
         ----------
         message : str
             Message to Broadcasters
 
+        Returns
+        -------
+        asyncio.Future[ChatMessage]
+            The future resolved with the message when the server echoes it.
+            It fails with :exc:`asyncio.TimeoutError` if the echo does not arrive within `send_timeout`.
+
         Raises
         ------
         RuntimeError
             Occurs when the client can't connect to a broadcaster's chat
+
+        Example
+        -------
+        >>> future = await client.send_chat("Hello")
+        >>> message = await future  # Wait until the server echoes the message.
         """
         if not self.is_connected:
             raise RuntimeError("Not connected to server. Please connect first.")
@@ -327,7 +706,14 @@ class ChatClient(Client):
         if not self.user_id:
             raise LoginRequired()
 
-        await self._gateway.send_chat(message, self.chat_channel_id)
+        return self.sender.submit(message)
+
+    @property
+    def send_metrics(self) -> dict[str, int | float]:
+        """The metrics of sending chats.
+        (queue_depth, pending, sent, acknowledged, timed_out, latency_p50, latency_p99)
+        """
+        return self.sender.metrics
 
     async def request_recent_chat(self, count: int = 50):
         """Send a request recent chat to chzzk.
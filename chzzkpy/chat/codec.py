@@ -0,0 +1,122 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Literal, Optional
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+try:
+    import msgspec
+except ModuleNotFoundError:
+    msgspec = None
+
+
+class JSONCodec:
+    """Represents a codec that (de)serializes gateway frames with the standard `json` module.
+    The other codecs extend this class."""
+
+    name: str = "json"
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+class OrjsonCodec(JSONCodec):
+    """Represents a codec based on `orjson` package."""
+
+    name: str = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ModuleNotFoundError("orjson is not installed.")
+
+    def loads(self, data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+
+class MsgspecCodec(JSONCodec):
+    """Represents a codec based on `msgspec` package."""
+
+    name: str = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ModuleNotFoundError("msgspec is not installed.")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: str | bytes) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode("utf-8")
+
+
+def available_codecs() -> list[str]:
+    """Get a list of codec names that can be used in this environment."""
+    result = []
+    if orjson is not None:
+        result.append(OrjsonCodec.name)
+    if msgspec is not None:
+        result.append(MsgspecCodec.name)
+    result.append(JSONCodec.name)
+    return result
+
+
+def get_codec(name: Optional[Literal["orjson", "msgspec", "json"]] = None) -> JSONCodec:
+    """Get a codec to (de)serialize gateway frames.
+
+    Parameters
+    ----------
+    name : Optional[Literal["orjson", "msgspec", "json"]]
+        The name of codec. If it is empty, the fastest installed codec is used.
+
+    Returns
+    -------
+    JSONCodec
+        The codec.
+    """
+    if name is None:
+        name = available_codecs()[0]
+
+    match name:
+        case OrjsonCodec.name:
+            return OrjsonCodec()
+        case MsgspecCodec.name:
+            return MsgspecCodec()
+        case JSONCodec.name:
+            return JSONCodec()
+        case _:
+            raise ValueError(f"Unknown codec: {name}")
@@ -0,0 +1,112 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class MessageDeduplicator:
+    """Represents a bounded LRU of received messages to drop duplicated messages.
+    The same message may arrive again with recent chats after reconnecting, or from redundant connections.
+    A message is identified by the channel, the user, the message time and the hash of content.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum number of remembered messages, by default 10000
+    window : Optional[float]
+        If it is set, messages are forgotten after the seconds since they were last seen.
+    """
+
+    def __init__(self, max_size: int = 10000, window: Optional[float] = None):
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0.")
+
+        self.max_size = max_size
+        self.window = window
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[tuple[Any, ...], float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """The metrics of deduplication. (size, hits, misses)"""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    @staticmethod
+    def key(message: dict[str, Any]) -> tuple[Any, ...]:
+        """Get the key identifying the raw message of CHAT or RECENT_CHAT."""
+        return (
+            message.get("cid") or message.get("channelId"),
+            message.get("uid") or message.get("userId"),
+            message.get("msgTime") or message.get("messageTime"),
+            hash(message.get("msg") or message.get("content")),
+        )
+
+    def seen(self, message: dict[str, Any]) -> bool:
+        """Check whether the message is received before, and remember the message.
+
+        Parameters
+        ----------
+        message : dict[str, Any]
+            The raw message of CHAT or RECENT_CHAT.
+
+        Returns
+        -------
+        bool
+            True if the message is a duplicate.
+        """
+        now = time.monotonic()
+        if self.window is not None:
+            self._expire(now)
+
+        key = self.key(message)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self._entries[key] = now
+            self.hits += 1
+            return True
+
+        self._entries[key] = now
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        self.misses += 1
+        return False
+
+    def _expire(self, now: float) -> None:
+        deadline = now - self.window
+        while len(self._entries) > 0:
+            key, last_seen = next(iter(self._entries.items()))
+            if last_seen >= deadline:
+                break
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -57,6 +57,12 @@ class ChatType(IntEnum):
     OPEN = 121
 
 
+class EventPriority(IntEnum):
+    LOW = 0  # Chat
+    NORMAL = 1  # System Message
+    HIGH = 2  # Donation / Subscription / Mission
+
+
 class UserRole(Enum):
     common_user = "common_user"
     streamer = "streamer"
@@ -65,8 +71,9 @@ class UserRole(Enum):
     manager = "manager"
 
 
-def get_enum(cls: type[E], val: Any) -> E:
-    enum_val = [i for i in cls if i.value == val]
-    if len(enum_val) == 0:
+def get_enum(cls: type[E], val: Any) -> E | Any:
+    """Get the member of enum by value. The unknown value is returned as it is."""
+    try:
+        return cls(val)
+    except ValueError:
         return val
-    return enum_val[0]
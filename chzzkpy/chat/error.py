@@ -48,3 +48,13 @@ class WebSocketClosure(Exception):
 
 class ReconnectWebsocket(Exception):
     pass
+
+
+class ChatRestricted(ChzzkpyException):
+    """Exception that’s raised when the user is temporarily restricted from sending chats."""
+
+    def __init__(self, times: int):
+        self.times: int = times
+        super(ChatRestricted, self).__init__(
+            f"Sending chats is temporarily restricted. (times: {times})"
+        )
@@ -0,0 +1,266 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Hashable, Literal, Optional
+
+from .enums import EventPriority
+
+_log = logging.getLogger(__name__)
+
+
+class _PriorityQueue:
+    """A queue of a worker. The handler of higher priority is taken first,
+    and the oldest handler of lowest priority is dropped first.
+    If `fifo` is set, handlers are taken in order of arrival regardless of priority."""
+
+    def __init__(self, fifo: bool = False):
+        self.fifo = fifo
+        self._queues: list[deque[tuple[int, Callable[[], Awaitable[Any]]]]] = [
+            deque() for _ in EventPriority
+        ]
+        self._counter = itertools.count()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(
+        self, callback: Callable[[], Awaitable[Any]], priority: EventPriority
+    ) -> None:
+        self._queues[priority].append((next(self._counter), callback))
+        self._size += 1
+
+    def pop(self) -> Callable[[], Awaitable[Any]]:
+        queues = [queue for queue in reversed(self._queues) if len(queue) > 0]
+        if len(queues) == 0:
+            raise IndexError("pop from an empty queue")
+
+        if self.fifo:
+            # Each queue is in order of arrival, so the oldest handler is one of the heads.
+            queue = min(queues, key=lambda x: x[0][0])
+        else:
+            queue = queues[0]
+        self._size -= 1
+        _, callback = queue.popleft()
+        return callback
+
+    def drop_oldest(self, priority: EventPriority) -> bool:
+        for queue in self._queues[: priority + 1]:
+            if len(queue) > 0:
+                self._size -= 1
+                queue.popleft()
+                return True
+        return False
+
+    def clear(self) -> None:
+        for queue in self._queues:
+            queue.clear()
+        self._size = 0
+
+
+class EventExecutor:
+    """Represents an executor that runs event handlers on a fixed pool of worker coroutines.
+    Each worker owns a bounded queue, and the overflow policy decides what happens when the queue is full.
+
+    Parameters
+    ----------
+    workers : int
+        The number of worker coroutines, by default 4
+    max_queue_size : int
+        The maximum number of pending handlers in a queue of each worker, by default 1000
+    overflow : Literal["block", "drop_oldest", "drop_newest"]
+        The policy when a queue is full, by default "block"
+
+        * `block`: The client stops reading the websocket until the queues have space.
+          The bound is soft: handlers of a frame being parsed are never dropped,
+          so a queue can exceed `max_queue_size` by the handlers of one frame.
+        * `drop_oldest`: The oldest pending handler of the lowest priority in the queue is dropped.
+          If the queue only has handlers of higher priority, the new handler is dropped.
+        * `drop_newest`: The new handler is dropped.
+
+        Handlers of higher priority (:class:`EventPriority`) are run first, unless `ordering` is set.
+    ordering : Optional[Literal["user", "event"]]
+        If it is set, handlers of the same user (or the same event) run in order of arrival on the same worker,
+        and the priority only decides which handler is dropped first.
+        By default, handlers are distributed to the least busy worker.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_queue_size: int = 1000,
+        overflow: Literal["block", "drop_oldest", "drop_newest"] = "block",
+        ordering: Optional[Literal["user", "event"]] = None,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be greater than 0.")
+        if overflow not in ("block", "drop_oldest", "drop_newest"):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.ordering = ordering
+
+        self.dropped: int = 0
+        self.processed: int = 0
+
+        self._queues: list[_PriorityQueue] = [
+            _PriorityQueue(fifo=ordering is not None) for _ in range(workers)
+        ]
+        self._wakeups: list[asyncio.Event] = [asyncio.Event() for _ in range(workers)]
+        self._space = asyncio.Event()
+        self._space.set()
+        self._tasks: list[asyncio.Task] = list()
+        self._closed = False
+
+    @property
+    def is_running(self) -> bool:
+        """Indicates if the workers are running."""
+        return len(self._tasks) > 0 and not self._closed
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of pending handlers in all queues."""
+        return sum(len(queue) for queue in self._queues)
+
+    @property
+    def queue_depths(self) -> list[int]:
+        """The number of pending handlers in a queue of each worker."""
+        return [len(queue) for queue in self._queues]
+
+    @property
+    def is_blocked(self) -> bool:
+        """Indicates if the websocket reader waits for space of queues. (`block` overflow)"""
+        return not self._space.is_set()
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """The metrics of executor. (queue_depth, dropped, processed)"""
+        return {
+            "queue_depth": self.queue_depth,
+            "dropped": self.dropped,
+            "processed": self.processed,
+        }
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the worker coroutines. If the workers are already running, nothing happens."""
+        if self.is_running:
+            return
+
+        self._closed = False
+        self._tasks = [
+            loop.create_task(self._worker(index), name=f"chzzk.py: worker {index}")
+            for index in range(self.workers)
+        ]
+
+    async def close(self) -> None:
+        """Stop the worker coroutines. Pending handlers are discarded."""
+        self._closed = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = list()
+
+        for queue in self._queues:
+            queue.clear()
+        self._space.set()
+
+    def submit(
+        self,
+        callback: Callable[[], Awaitable[Any]],
+        key: Optional[Hashable] = None,
+        priority: EventPriority = EventPriority.NORMAL,
+    ) -> bool:
+        """Put a handler to a queue of the worker.
+
+        Parameters
+        ----------
+        callback : Callable[[], Awaitable[Any]]
+            A function that returns an awaitable to run.
+        key : Optional[Hashable]
+            The key to keep order. Handlers with the same key run on the same worker.
+        priority : EventPriority
+            The priority of handler, by default NORMAL
+
+        Returns
+        -------
+        bool
+            Returns False if the handler is dropped.
+        """
+        if self.ordering is not None and key is not None:
+            index = hash(key) % self.workers
+        else:
+            index = min(range(self.workers), key=lambda x: len(self._queues[x]))
+        queue = self._queues[index]
+
+        if len(queue) >= self.max_queue_size:
+            if self.overflow == "drop_newest":
+                self.dropped += 1
+                return False
+            elif self.overflow == "drop_oldest":
+                self.dropped += 1
+                if not queue.drop_oldest(priority):
+                    return False
+            else:
+                # The reader waits for space with `wait_for_capacity` method.
+                self._space.clear()
+
+        queue.append(callback, priority)
+        self._wakeups[index].set()
+        return True
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until all queues have space. It is used to block the websocket reader."""
+        await self._space.wait()
+
+    def _has_capacity(self) -> bool:
+        return all(len(queue) < self.max_queue_size for queue in self._queues)
+
+    async def _worker(self, index: int) -> None:
+        queue = self._queues[index]
+        wakeup = self._wakeups[index]
+        while not self._closed:
+            if len(queue) == 0:
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+
+            callback = queue.pop()
+            if not self._space.is_set() and self._has_capacity():
+                self._space.set()
+
+            try:
+                await callback()
+            except asyncio.CancelledError:
+                if self._closed:
+                    raise
+            except Exception:
+                _log.exception("Ignoring exception in worker %s", index)
+            self.processed += 1
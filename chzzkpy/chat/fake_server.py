@@ -0,0 +1,470 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+import uuid
+from collections import Counter, deque
+from typing import Any, Optional
+
+import aiohttp
+from aiohttp import web
+
+from .enums import ChatCmd, ChatType
+
+DEFAULT_MESSAGE_TYPES: dict[str, float] = {
+    "chat": 0.9,
+    "donation": 0.04,
+    "subscription": 0.02,
+    "system_message": 0.01,
+    "notice": 0.01,
+    "blind": 0.01,
+    "mission": 0.01,
+}
+
+
+class FakeChatServer:
+    """Represents a local chat server that speaks the protocol of Chzzk chat.
+    It generates synthetic messages for integration and load testing without network.
+
+    Parameters
+    ----------
+    host : str
+        The host to bind, by default "127.0.0.1"
+    port : int
+        The port to bind. If it is 0, a free port is used.
+    rate : float
+        The number of messages per second sent to each connection, by default 10.0
+        If it is 0, messages are not generated.
+    message_types : Optional[dict[str, float]]
+        The weights of generated message types.
+        (`chat`, `donation`, `subscription`, `system_message`, `notice`, `blind`, `mission`)
+    messages_per_frame : int
+        The number of chats in a frame of CHAT and SPECIAL_CHAT, by default 1
+    users : int
+        The number of synthetic users who send messages, by default 20
+    history_size : int
+        The number of messages kept for RECENT_CHAT, by default 50
+    respond_ping : bool
+        If it is false, PING is ignored to simulate a dead connection.
+    disconnect_after : Optional[float]
+        If it is set, each connection is closed with `close_code` after the seconds.
+    close_code : int
+        The close code of injected disconnects, by default 1001 (Going Away)
+    seed : Optional[int]
+        The seed of random generator for reproducible traffic.
+
+    Example
+    -------
+    >>> async with FakeChatServer(rate=100.0) as server:
+    ...     client = ChatClient("channel_id", chat_channel_id="N1SGD0", chat_server_url=server.url)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rate: float = 10.0,
+        message_types: Optional[dict[str, float]] = None,
+        messages_per_frame: int = 1,
+        users: int = 20,
+        history_size: int = 50,
+        respond_ping: bool = True,
+        disconnect_after: Optional[float] = None,
+        close_code: int = aiohttp.WSCloseCode.GOING_AWAY,
+        seed: Optional[int] = None,
+    ):
+        message_types = message_types or DEFAULT_MESSAGE_TYPES
+        for message_type in message_types.keys():
+            if message_type not in DEFAULT_MESSAGE_TYPES.keys():
+                raise ValueError(f"Unknown message type: {message_type}")
+
+        self.host = host
+        self.port = port
+        self.rate = rate
+        self.message_types = message_types
+        self.messages_per_frame = messages_per_frame
+        self.users = users
+        self.respond_ping = respond_ping
+        self.disconnect_after = disconnect_after
+        self.close_code = close_code
+
+        self.connections: list[web.WebSocketResponse] = list()
+        self.connection_count: int = 0
+        self.received: list[dict[str, Any]] = list()
+        self.sent: Counter[str] = Counter()
+
+        self._random = random.Random(seed)
+        self._history: deque[dict[str, Any]] = deque(maxlen=history_size)
+        self._index: int = 0
+        self._closing: dict[web.WebSocketResponse, asyncio.Task] = dict()
+        self._runner: Optional[web.AppRunner] = None
+        self._site: Optional[web.TCPSite] = None
+
+    @property
+    def url(self) -> str:
+        """The URL of websocket to pass as `chat_server_url`."""
+        return f"ws://{self.host}:{self.port}/chat"
+
+    async def start(self) -> None:
+        """Start the server."""
+        app = web.Application()
+        app.router.add_get("/chat", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        self._site = web.TCPSite(self._runner, self.host, self.port)
+        await self._site.start()
+        if self.port == 0:
+            self.port = self._site._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Close all connections and stop the server."""
+        await self.disconnect(aiohttp.WSCloseCode.GOING_AWAY)
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
+
+    async def disconnect(self, code: Optional[int] = None) -> None:
+        """Close all connections with the close code.
+
+        Parameters
+        ----------
+        code : Optional[int]
+            The close code. If it is empty, `close_code` is used.
+        """
+        tasks = [
+            self._close(connection, code or self.close_code)
+            for connection in list(self.connections)
+        ]
+        await asyncio.gather(*tasks)
+
+    async def broadcast(self, cmd: ChatCmd, body: Any) -> None:
+        """Send a frame to all connections."""
+        data = json.dumps(self._frame(cmd, body), ensure_ascii=False)
+        for connection in list(self.connections):
+            if not connection.closed:
+                await connection.send_str(data)
+
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        connection = web.WebSocketResponse()
+        await connection.prepare(request)
+        self.connections.append(connection)
+        self.connection_count += 1
+
+        tasks: list[asyncio.Task] = list()
+        disconnect_handle: Optional[asyncio.TimerHandle] = None
+        user_id: Optional[str] = None
+        try:
+            async for message in connection:
+                if message.type is not aiohttp.WSMsgType.TEXT:
+                    continue
+                data = json.loads(message.data)
+                self.received.append(data)
+
+                match data.get("cmd"):
+                    case ChatCmd.CONNECT:
+                        user_id = data["bdy"].get("uid")
+                        await self._send(
+                            connection,
+                            ChatCmd.CONNECTED,
+                            {
+                                "sid": uuid.uuid4().hex,
+                                "uuid": user_id,
+                                "accTkn": data["bdy"].get("accTkn"),
+                                "auth": data["bdy"].get("auth"),
+                            },
+                            tid=data.get("tid"),
+                        )
+                        tasks.append(asyncio.create_task(self._generate(connection)))
+                        if self.disconnect_after is not None:
+                            disconnect_handle = asyncio.get_running_loop().call_later(
+                                self.disconnect_after,
+                                self._close,
+                                connection,
+                                self.close_code,
+                            )
+                    case ChatCmd.PING:
+                        if self.respond_ping:
+                            await connection.send_str(
+                                json.dumps({"cmd": ChatCmd.PONG, "ver": "2"})
+                            )
+                    case ChatCmd.REQUEST_RECENT_CHAT:
+                        count = data["bdy"].get("recentMessageCount", 50)
+                        await self._send(
+                            connection,
+                            ChatCmd.RECENT_CHAT,
+                            self._recent_chat(count),
+                            tid=data.get("tid"),
+                        )
+                    case ChatCmd.SEND_CHAT:
+                        chat = self._make_message(
+                            ChatType.TEXT, user_id or "", data["bdy"]["msg"]
+                        )
+                        self._history.append(chat)
+                        await self.broadcast(ChatCmd.CHAT, [chat])
+        finally:
+            for task in tasks:
+                task.cancel()
+            if disconnect_handle is not None:
+                disconnect_handle.cancel()
+            self.connections.remove(connection)
+
+            # Otherwise, the connection is closed with 1000 when the handler returns.
+            closing = self._closing.pop(connection, None)
+            if closing is not None:
+                await closing
+        return connection
+
+    def _close(self, connection: web.WebSocketResponse, code: int) -> asyncio.Task:
+        if connection not in self._closing.keys():
+            self._closing[connection] = asyncio.create_task(connection.close(code=code))
+        return self._closing[connection]
+
+    async def _generate(self, connection: web.WebSocketResponse) -> None:
+        started_at = time.monotonic()
+        frames = 0
+        while not connection.closed:
+            if self.rate <= 0:
+                await asyncio.sleep(0.1)
+                started_at, frames = time.monotonic(), 0
+                continue
+
+            frame_rate = self.rate / self.messages_per_frame
+            due = int((time.monotonic() - started_at) * frame_rate)
+            # Frames of high rate are sent in a burst, because the sleep is not precise.
+            while frames < due and not connection.closed:
+                message_type = self._random.choices(
+                    list(self.message_types.keys()),
+                    list(self.message_types.values()),
+                )[0]
+                cmd, body = getattr(self, f"_make_{message_type}")()
+                await self._send(connection, cmd, body)
+                self.sent[message_type] += 1
+                frames += 1
+            await asyncio.sleep(1 / frame_rate)
+
+    async def _send(
+        self,
+        connection: web.WebSocketResponse,
+        cmd: ChatCmd,
+        body: Any,
+        tid: Optional[int] = None,
+    ) -> None:
+        data = self._frame(cmd, body, tid)
+        await connection.send_str(json.dumps(data, ensure_ascii=False))
+
+    @staticmethod
+    def _frame(cmd: ChatCmd, body: Any, tid: Optional[int] = None) -> dict[str, Any]:
+        return {
+            "svcid": "game",
+            "ver": "1",
+            "cmd": int(cmd),
+            "cid": "fake",
+            "tid": tid,
+            "bdy": body,
+        }
+
+    # Synthetic messages
+    def _user_id(self) -> str:
+        return f"{self._random.randrange(self.users):032x}"
+
+    @staticmethod
+    def _profile(user_id: str) -> dict[str, Any]:
+        return {
+            "userIdHash": user_id,
+            "nickname": f"viewer-{user_id[-4:]}",
+            "profileImageUrl": None,
+            "userRoleCode": "common_user",
+            "badge": None,
+            "title": None,
+            "verifiedMark": False,
+            "activityBadges": [],
+            "streamingProperty": {},
+        }
+
+    @staticmethod
+    def _extras(**kwargs) -> dict[str, Any]:
+        data = {
+            "chatType": "STREAMING",
+            "emojis": {},
+            "osType": "PC",
+            "streamingChannelId": "fake",
+        }
+        data.update(kwargs)
+        return data
+
+    def _make_message(
+        self,
+        message_type: ChatType,
+        user_id: str,
+        content: str,
+        extras: Optional[dict[str, Any]] = None,
+        profile: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        self._index += 1
+        message_time = int(time.time() * 1000)
+        return {
+            "svcid": "game",
+            "cid": "fake",
+            "mbrCnt": len(self.connections),
+            "uid": user_id,
+            "profile": json.dumps(profile or self._profile(user_id)),
+            "msg": content,
+            "msgTypeCode": int(message_type),
+            "msgStatusType": "NORMAL",
+            "extras": json.dumps(extras or self._extras()),
+            "ctime": message_time,
+            "utime": message_time,
+            "msgTid": None,
+            "msgTime": message_time,
+        }
+
+    def _make_chats(self, message_type: ChatType, **kwargs) -> list[dict[str, Any]]:
+        messages = list()
+        for _ in range(self.messages_per_frame):
+            message = self._make_message(
+                message_type, self._user_id(), f"message {self._index}", **kwargs
+            )
+            messages.append(message)
+        return messages
+
+    def _make_chat(self) -> tuple[ChatCmd, Any]:
+        messages = self._make_chats(ChatType.TEXT)
+        self._history.extend(messages)
+        return ChatCmd.CHAT, messages
+
+    def _donation_extras(self, **kwargs) -> dict[str, Any]:
+        return self._extras(
+            isAnonymous=False,
+            payType="CURRENCY",
+            payAmount=self._random.choice((1000, 5000, 10000)),
+            weeklyRankList=[],
+            **kwargs,
+        )
+
+    def _make_donation(self) -> tuple[ChatCmd, Any]:
+        extras = self._donation_extras(donationType="CHAT")
+        return ChatCmd.SPECIAL_CHAT, self._make_chats(ChatType.DONATION, extras=extras)
+
+    def _make_subscription(self) -> tuple[ChatCmd, Any]:
+        extras = self._extras(
+            month=self._random.randint(1, 24), tierName="Tier 1", tierNo=1
+        )
+        return ChatCmd.SPECIAL_CHAT, self._make_chats(
+            ChatType.SUBSCRIPTION, extras=extras
+        )
+
+    def _make_system_message(self) -> tuple[ChatCmd, Any]:
+        manager_id, target_id = self._user_id(), self._user_id()
+        extras = {
+            "description": "{registerNickname} blinded a message of {targetNickname}.",
+            "styleType": 1,
+            "visibleRoles": ["common_user"],
+            "params": {
+                "registerNickname": f"viewer-{manager_id[-4:]}",
+                "targetNickname": f"viewer-{target_id[-4:]}",
+                "registerChatProfileJson": json.dumps(self._profile(manager_id)),
+                "targetChatProfileJson": json.dumps(self._profile(target_id)),
+            },
+        }
+        message = self._make_message(
+            ChatType.SYSTEM_MESSAGE, "@OPEN", "", extras=extras
+        )
+        message["profile"] = None
+        return ChatCmd.SPECIAL_CHAT, [message]
+
+    def _make_notice(self) -> tuple[ChatCmd, Any]:
+        message = self._make_message(ChatType.TEXT, self._user_id(), "notice")
+        extras = json.loads(message["extras"])
+        extras["registerProfile"] = self._profile(message["uid"])
+        return ChatCmd.NOTICE, {
+            "serviceId": "game",
+            "channelId": "fake",
+            "messageTime": message["msgTime"],
+            "userId": message["uid"],
+            "profile": message["profile"],
+            "content": message["msg"],
+            "messageTypeCode": message["msgTypeCode"],
+            "extras": json.dumps(extras),
+            "createTime": message["ctime"],
+            "updateTime": message["utime"],
+        }
+
+    def _make_blind(self) -> tuple[ChatCmd, Any]:
+        return ChatCmd.BLIND, {
+            "serviceId": "game",
+            "messageTime": int(time.time() * 1000),
+            "blindType": "CBOTBLIND",
+            "blindUserId": None,
+            "userId": self._user_id(),
+            "message": None,
+        }
+
+    def _make_mission(self) -> tuple[ChatCmd, Any]:
+        data = self._donation_extras(
+            donationType="MISSION",
+            durationTime=180,
+            missionDonationId=uuid.uuid4().hex,
+            missionDonationType="ALONE",
+            missionCreatedTime=time.strftime("%Y-%m-%d %H:%M:%S"),
+            missionText="mission",
+            status="PENDING",
+            success=False,
+        )
+        data["type"] = "DONATION_MISSION_IN_PROGRESS"
+        return ChatCmd.EVENT, data
+
+    def _recent_chat(self, count: int) -> dict[str, Any]:
+        messages = list(self._history)[-count:] if count > 0 else list()
+        return {
+            "messageList": [
+                {
+                    "serviceId": "game",
+                    "channelId": "fake",
+                    "messageTime": message["msgTime"],
+                    "userId": message["uid"],
+                    "profile": message["profile"],
+                    "content": message["msg"],
+                    "messageTypeCode": message["msgTypeCode"],
+                    "messageStatusType": message["msgStatusType"],
+                    "extras": message["extras"],
+                    "createTime": message["ctime"],
+                    "updateTime": message["utime"],
+                    "memberCount": message["mbrCnt"],
+                }
+                for message in messages
+            ],
+            "userCount": len(self.connections),
+            "notice": None,
+        }
@@ -0,0 +1,335 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, Literal, Optional
+
+from .enums import ChatType
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None
+
+
+class ChatFrame:
+    """Represents a columnar accumulator of messages based on NumPy arrays, for vectorized analytics.
+    Each message is stored as the time (int64 epoch milliseconds), the categorical code of user (int32),
+    the type code (int16, :class:`ChatType`) and the amount of donation (int64).
+    The arrays grow in chunks.
+
+    Parameters
+    ----------
+    chunk_size : int
+        The number of messages that the arrays grow at once, by default 65536
+    """
+
+    def __init__(self, chunk_size: int = 65536):
+        if np is None:
+            raise ModuleNotFoundError("numpy is not installed.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0.")
+
+        self.chunk_size = chunk_size
+        self.users: list[str] = list()
+
+        self._size: int = 0
+        self._user_codes: dict[str, int] = dict()
+        self._time = np.empty(0, dtype=np.int64)
+        self._user = np.empty(0, dtype=np.int32)
+        self._type = np.empty(0, dtype=np.int16)
+        self._pay_amount = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def times(self) -> np.ndarray:
+        """The times of messages in epoch milliseconds."""
+        return self._time[: self._size]
+
+    @property
+    def user_codes(self) -> np.ndarray:
+        """The codes of users. The user ID of code is `users[code]`."""
+        return self._user[: self._size]
+
+    @property
+    def types(self) -> np.ndarray:
+        """The type codes of messages."""
+        return self._type[: self._size]
+
+    @property
+    def pay_amounts(self) -> np.ndarray:
+        """The amounts of donation. It is 0 if the message is not a donation."""
+        return self._pay_amount[: self._size]
+
+    def _grow(self) -> None:
+        capacity = len(self._time) + self.chunk_size
+        self._time = np.resize(self._time, capacity)
+        self._user = np.resize(self._user, capacity)
+        self._type = np.resize(self._type, capacity)
+        self._pay_amount = np.resize(self._pay_amount, capacity)
+
+    def user_code(self, user_id: str) -> int:
+        """Get the categorical code of user. A new user is given the next code."""
+        code = self._user_codes.get(user_id)
+        if code is None:
+            code = self._user_codes[user_id] = len(self.users)
+            self.users.append(user_id)
+        return code
+
+    def append(
+        self, user_id: str, message_type: int, time: int, pay_amount: int = 0
+    ) -> None:
+        """Append a message.
+
+        Parameters
+        ----------
+        user_id : str
+            The user ID hash of sender.
+        message_type : int
+            The type code of message.
+        time : int
+            The time that the message is sent, in epoch milliseconds.
+        pay_amount : int
+            The amount of donation, by default 0
+        """
+        if self._size == len(self._time):
+            self._grow()
+
+        index = self._size
+        self._time[index] = time
+        self._user[index] = self.user_code(user_id)
+        self._type[index] = message_type
+        self._pay_amount[index] = pay_amount
+        self._size += 1
+
+    def append_message(
+        self, message: dict[str, Any], loads: Callable[[str], Any]
+    ) -> None:
+        """Append the raw message of CHAT or RECENT_CHAT.
+
+        Parameters
+        ----------
+        message : dict[str, Any]
+            The raw message.
+        loads : Callable[[str], Any]
+            The function to deserialize the raw JSON of `extras`, which includes the amount of donation.
+        """
+        message_type = message.get("msgTypeCode") or message.get("messageTypeCode")
+        if message_type is None:
+            return
+
+        pay_amount = 0
+        if message_type == ChatType.DONATION and message.get("extras"):
+            pay_amount = loads(message["extras"]).get("payAmount") or 0
+
+        self.append(
+            user_id=message.get("uid") or message.get("userId") or "",
+            message_type=message_type,
+            time=message.get("msgTime") or message.get("messageTime") or 0,
+            pay_amount=pay_amount,
+        )
+
+    def _select(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        message_type: Optional[int] = None,
+    ) -> np.ndarray:
+        mask = np.ones(self._size, dtype=bool)
+        if start is not None:
+            mask &= self.times >= start
+        if end is not None:
+            mask &= self.times < end
+        if message_type is not None:
+            mask &= self.types == message_type
+        return mask
+
+    def _bins(
+        self, mask: np.ndarray, interval: int, start: Optional[int], end: Optional[int]
+    ) -> tuple[np.ndarray, int, int]:
+        times = self.times[mask]
+        if start is None:
+            start = int(times.min()) if len(times) > 0 else 0
+        if end is None:
+            end = int(times.max()) + 1 if len(times) > 0 else start
+        length = max(0, -(-(end - start) // interval))
+        return (times - start) // interval, start, length
+
+    def rate_histogram(
+        self,
+        interval: int = 60000,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        message_type: Optional[int] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Count messages per interval.
+
+        Parameters
+        ----------
+        interval : int
+            The interval of bins in milliseconds, by default 60000 (1 minute)
+        start : Optional[int]
+            The start time in epoch milliseconds. By default, the time of the first message.
+        end : Optional[int]
+            The end time (exclusive) in epoch milliseconds. By default, after the last message.
+        message_type : Optional[int]
+            If it is set, only messages of the type are counted.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The start times of bins, and the number of messages in each bin.
+        """
+        mask = self._select(start, end, message_type)
+        bins, start, length = self._bins(mask, interval, start, end)
+        counts = np.bincount(bins, minlength=length)[:length]
+        return start + np.arange(length, dtype=np.int64) * interval, counts
+
+    def unique_users_histogram(
+        self,
+        interval: int = 60000,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        message_type: Optional[int] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Count unique users who sent messages per interval.
+        The parameters and the return value are the same as :meth:`rate_histogram`."""
+        mask = self._select(start, end, message_type)
+        bins, start, length = self._bins(mask, interval, start, end)
+        pairs = np.unique(bins * len(self.users) + self.user_codes[mask])
+        counts = np.bincount(pairs // max(len(self.users), 1), minlength=length)
+        return start + np.arange(length, dtype=np.int64) * interval, counts[:length]
+
+    def rolling_sum(
+        self,
+        window: int,
+        interval: int = 60000,
+        column: Literal["count", "pay_amount"] = "pay_amount",
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        message_type: Optional[int] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Sum the number of messages or the amount of donation over a sliding window, at each interval.
+
+        Parameters
+        ----------
+        window : int
+            The size of sliding window in milliseconds. It is rounded up to a multiple of `interval`.
+        interval : int
+            The step of window in milliseconds, by default 60000 (1 minute)
+        column : Literal["count", "pay_amount"]
+            The column to sum, by default "pay_amount"
+        start : Optional[int]
+            The start time in epoch milliseconds. By default, the time of the first message.
+        end : Optional[int]
+            The end time (exclusive) in epoch milliseconds. By default, after the last message.
+        message_type : Optional[int]
+            If it is set, only messages of the type are summed.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The start times of bins, and the sum of the window that ends with each bin.
+        """
+        mask = self._select(start, end, message_type)
+        bins, start, length = self._bins(mask, interval, start, end)
+        weights = None if column == "count" else self.pay_amounts[mask]
+        sums = np.bincount(bins, weights=weights, minlength=length)[:length].astype(
+            np.int64
+        )
+        steps = max(1, -(-window // interval))
+        cumulative = np.concatenate(([0], np.cumsum(sums)))
+        rolling = (
+            cumulative[1:] - cumulative[np.maximum(np.arange(length) + 1 - steps, 0)]
+        )
+        return start + np.arange(length, dtype=np.int64) * interval, rolling
+
+    def top_users(
+        self,
+        count: int = 10,
+        by: Literal["count", "pay_amount"] = "count",
+        message_type: Optional[int] = None,
+    ) -> list[tuple[str, int]]:
+        """Get the users who sent the most messages or donated the most.
+
+        Parameters
+        ----------
+        count : int
+            The number of users, by default 10
+        by : Literal["count", "pay_amount"]
+            The column to rank users, by default "count"
+        message_type : Optional[int]
+            If it is set, only messages of the type are ranked.
+
+        Returns
+        -------
+        list[tuple[str, int]]
+            The user ID and the value, in descending order.
+        """
+        mask = self._select(message_type=message_type)
+        weights = None if by == "count" else self.pay_amounts[mask]
+        totals = np.bincount(
+            self.user_codes[mask], weights=weights, minlength=len(self.users)
+        )
+        order = np.argsort(totals, kind="stable")[::-1][:count]
+        return [
+            (self.users[code], int(totals[code])) for code in order if totals[code] > 0
+        ]
+
+    def to_npz(self, path: str | os.PathLike, compressed: bool = True) -> None:
+        """Export the columns and the user IDs to a `.npz` file.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The path of file.
+        compressed : bool
+            If it is true, the file is compressed, by default True
+        """
+        save = np.savez_compressed if compressed else np.savez
+        save(
+            path,
+            time=self.times,
+            user=self.user_codes,
+            type=self.types,
+            pay_amount=self.pay_amounts,
+            users=np.array(self.users, dtype=str),
+        )
+
+    @classmethod
+    def from_npz(cls, path: str | os.PathLike, chunk_size: int = 65536) -> ChatFrame:
+        """Load the frame exported with :meth:`to_npz`."""
+        frame = cls(chunk_size=chunk_size)
+        with np.load(path) as data:
+            frame.users = data["users"].tolist()
+            frame._user_codes = {user: code for code, user in enumerate(frame.users)}
+            frame._time = data["time"].astype(np.int64)
+            frame._user = data["user"].astype(np.int32)
+            frame._type = data["type"].astype(np.int16)
+            frame._pay_amount = data["pay_amount"].astype(np.int64)
+        frame._size = len(frame._time)
+        return frame
@@ -24,13 +24,15 @@ SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import math
 import time
+from collections import deque
 from typing import Any, Callable, Optional, Literal, TYPE_CHECKING
 
 import aiohttp
 
+from .codec import JSONCodec, get_codec
 from .enums import ChatCmd, get_enum, ChatType
 from .error import ConnectionClosed, WebSocketClosure, ReconnectWebsocket
 
@@ -38,6 +40,7 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
     from .chat_client import ChatClient
+    from .recorder import FrameRecorder
     from .state import ConnectionState
 
 _log = logging.getLogger(__name__)
@@ -48,13 +51,25 @@ class ChzzkWebSocket:
         self,
         socket: aiohttp.ClientWebSocketResponse,
         loop: asyncio.AbstractEventLoop,
+        codec: Optional[JSONCodec] = None,
     ):
         self.socket: aiohttp.ClientWebSocketResponse = socket
         self.loop: asyncio.AbstractEventLoop = loop
+        self.codec: JSONCodec = codec or get_codec()
         self.session_id: Optional[str] = None
 
         self._max_timeout: float = 60.0
 
+        # Heartbeat
+        self.latencies: deque[float] = deque(maxlen=100)
+        self._ping_sent_at: Optional[float] = None
+        self._missed_heartbeats: int = 0
+        self._heartbeat_failed: bool = False
+        self._heartbeat_paused: bool = False
+        self._heartbeat: Optional[asyncio.Task] = None
+
+        self.recorder: Optional[FrameRecorder] = None
+
         self._event_hook: dict[ChatCmd, Optional[Callable[..., Any]]] = {
             key: None for key in list(ChatCmd)
         }
@@ -65,6 +80,11 @@ class ChzzkWebSocket:
     def remove_hook(self, cmd: ChatCmd):
         self._event_hook[cmd] = None
 
+    @staticmethod
+    def server_id(channel_id: str) -> int:
+        """Get the chat server number (`kr-ss{server_id}`) of the chat channel."""
+        return abs(sum([ord(x) for x in channel_id])) % 9 + 1
+
     @classmethod
     async def new_session(
         cls,
@@ -72,12 +92,19 @@ class ChzzkWebSocket:
         session: aiohttp.ClientSession,
         channel_id: str,
         session_id: Optional[str] = None,
+        codec: Optional[JSONCodec] = None,
+        url: Optional[str] = None,
+        close_timeout: float = 2.0,
     ) -> Self:
-        server_id = abs(sum([ord(x) for x in channel_id])) % 9 + 1
-        url = f"wss://kr-ss{server_id}.chat.naver.com/chat"
-        socket: aiohttp.ClientWebSocketResponse = await session.ws_connect(url)
+        if url is None:
+            server_id = cls.server_id(channel_id)
+            url = f"wss://kr-ss{server_id}.chat.naver.com/chat"
+        # A dead peer never answers the closing handshake, so it waits only `close_timeout` seconds.
+        socket: aiohttp.ClientWebSocketResponse = await session.ws_connect(
+            url, timeout=close_timeout
+        )
 
-        websocket = cls(socket, loop)
+        websocket = cls(socket, loop, codec=codec)
         websocket.session_id = session_id
         return websocket
 
@@ -93,13 +120,124 @@ class ChzzkWebSocket:
             session=client.ws_session,
             channel_id=client.chat_channel_id,
             session_id=session_id,
+            codec=client.codec,
+            url=client.chat_server_url,
         )
         for cmd, parsing_func in state.parsers.items():
             if parsing_func is None:
                 continue
             websocket.set_hook(cmd, parsing_func)
+        websocket.recorder = client.recorder
+
+        if client.heartbeat_interval is not None:
+            websocket.start_heartbeat(
+                client.heartbeat_interval, client.max_missed_heartbeats
+            )
         return websocket
 
+    @property
+    def latency(self) -> float:
+        """The latency in seconds between a PING and PONG of the latest heartbeat.
+        If no heartbeat is measured, returns `inf`."""
+        if len(self.latencies) == 0:
+            return math.inf
+        return self.latencies[-1]
+
+    def latency_histogram(
+        self, buckets: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+    ) -> dict[float, int]:
+        """Get a histogram of recent latencies.
+
+        Parameters
+        ----------
+        buckets : tuple[float, ...]
+            The upper bounds in seconds of each bucket. A bucket of `inf` is added at the end.
+
+        Returns
+        -------
+        dict[float, int]
+            The number of latencies less than or equal to each upper bound, but greater than the previous one.
+        """
+        result = {bucket: 0 for bucket in (*buckets, math.inf)}
+        for latency in self.latencies:
+            for bucket in result.keys():
+                if latency <= bucket:
+                    result[bucket] += 1
+                    break
+        return result
+
+    def start_heartbeat(self, interval: float, max_missed: int = 2) -> None:
+        """Start a task that sends PING periodically.
+        If PONG is not received for `max_missed` heartbeats, the connection is considered dead
+        and :exc:`ReconnectWebsocket` is raised at :meth:`poll_event`.
+
+        Parameters
+        ----------
+        interval : float
+            The interval in seconds between heartbeats.
+        max_missed : int
+            The number of missed heartbeats to consider the connection dead, by default 2
+        """
+        self.stop_heartbeat()
+        self._heartbeat = self.loop.create_task(
+            self._heartbeat_loop(interval, max_missed), name="chzzk.py: heartbeat"
+        )
+
+    def stop_heartbeat(self) -> None:
+        if (
+            self._heartbeat is not None
+            and self._heartbeat is not asyncio.current_task()
+        ):
+            self._heartbeat.cancel()
+        self._heartbeat = None
+
+    def pause_heartbeat(self) -> None:
+        """Stop counting missed heartbeats while the reader is paused. (ex. backpressure)
+        PONG is not read until the reader is resumed, so a healthy connection would be considered dead.
+        """
+        self._heartbeat_paused = True
+
+    def resume_heartbeat(self) -> None:
+        """Resume the heartbeat paused by :meth:`pause_heartbeat` from the next interval."""
+        self._heartbeat_paused = False
+        self._ping_sent_at = None
+        self._missed_heartbeats = 0
+
+    async def _heartbeat_loop(self, interval: float, max_missed: int) -> None:
+        while not self.socket.closed:
+            await asyncio.sleep(interval)
+            if self._heartbeat_paused:
+                continue
+            if self._ping_sent_at is not None:
+                self._missed_heartbeats += 1
+                if self._missed_heartbeats >= max_missed:
+                    _log.warning(
+                        "No PONG for %d heartbeats. Closing the dead connection.",
+                        self._missed_heartbeats,
+                    )
+                    await self._close_dead_connection()
+                    return
+            self._ping_sent_at = None
+            try:
+                await self.send_ping()
+            except Exception as exc:
+                _log.warning("Failed to send PING. Closing the connection: %s", exc)
+                await self._close_dead_connection()
+                return
+
+    async def _close_dead_connection(self) -> None:
+        self._heartbeat_failed = True
+        # The heartbeat task is cancelled by `poll_event` when the closure is received,
+        # so the closing runs in another task to release the connection.
+        await asyncio.shield(self.socket.close(code=aiohttp.WSCloseCode.GOING_AWAY))
+
+    def _received_pong(self) -> None:
+        if self._ping_sent_at is None:
+            return
+        self.latencies.append(time.perf_counter() - self._ping_sent_at)
+        self._ping_sent_at = None
+        self._missed_heartbeats = 0
+
     @property
     def default_body(self) -> dict[str, str]:
         return {"svcid": "game", "ver": "2"}
@@ -113,7 +251,9 @@ class ChzzkWebSocket:
         try:
             msg = await self.socket.receive(timeout=59.0)
             if msg.type is aiohttp.WSMsgType.TEXT:
-                data = msg.json()
+                if self.recorder is not None:
+                    self.recorder.record(msg.data)
+                data = self.codec.loads(msg.data)
                 await self.received_message(data)
             elif msg.type is aiohttp.WSMsgType.ERROR:
                 _log.debug("Received error %s", msg)
@@ -129,8 +269,9 @@ class ChzzkWebSocket:
             await self.send_ping()
             _log.debug("Timeout receiving packet. Send to ping for keep-alive")
         except WebSocketClosure:
+            self.stop_heartbeat()
             code = self.socket.close_code
-            if self._can_handle_close(code):
+            if self._heartbeat_failed or self._can_handle_close(code):
                 raise ReconnectWebsocket()
             else:
                 raise ConnectionClosed(self.socket, code)
@@ -152,6 +293,9 @@ class ChzzkWebSocket:
         elif cmd_type == ChatCmd.PING:
             await self.send_pong()
             return
+        elif cmd_type == ChatCmd.PONG:
+            self._received_pong()
+            return
 
         func = self._event_hook.get(cmd_type)
         if func is not None:
@@ -162,13 +306,14 @@ class ChzzkWebSocket:
         await self.socket.send_str(data)
 
     async def send_json(self, data: dict[str, Any]) -> None:
-        _log.debug("Sending JSON: %s", json.dumps(data))
-        await self.socket.send_json(data)
+        await self.send(self.codec.dumps(data))
 
     async def send_pong(self):
         await self.send_json({"cmd": ChatCmd.PONG, "ver": 2})
 
     async def send_ping(self):
+        if self._ping_sent_at is None:
+            self._ping_sent_at = time.perf_counter()
         await self.send_json({"cmd": ChatCmd.PING, "ver": 2})
 
     async def send_open(
@@ -192,7 +337,7 @@ class ChzzkWebSocket:
         data.update(self.default_body)
         await self.send_json(data)
 
-    async def send_chat(self, message: str, chat_channel_id: str):
+    async def send_chat(self, message: str, chat_channel_id: str, tid: int = 3):
         extra: dict[str, Any] = {
             "chatType": "STREAMING",
             "emojis": "",
@@ -202,7 +347,7 @@ class ChzzkWebSocket:
 
         data: dict[str, Any] = {
             "bdy": {
-                "extras": json.dumps(extra),
+                "extras": self.codec.dumps(extra),
                 "msg": message,
                 "msgTime": int(time.time() * 1000),
                 "msgTypeCode": ChatType.TEXT,
@@ -211,7 +356,7 @@ class ChzzkWebSocket:
             "cmd": ChatCmd.SEND_CHAT,
             "sid": self.session_id,
             "cid": chat_channel_id,
-            "tid": 3,
+            "tid": tid,
         }
         data.update(self.default_body)
         await self.send_json(data)
@@ -11,8 +11,8 @@ from ..http import ChzzkSession, NaverGameAPISession
 
 
 class ChzzkChatSession(NaverGameAPISession):
-    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
-        super().__init__(loop=loop)
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None, **kwargs):
+        super().__init__(loop=loop, **kwargs)
 
         self.delete_notice_message.before_hook(ChzzkChatSession.query_to_json)
         self.set_notice_message.before_hook(ChzzkChatSession.query_to_json)
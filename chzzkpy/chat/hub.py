@@ -0,0 +1,386 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Optional, Callable, Coroutine, TYPE_CHECKING
+
+import aiohttp
+
+from .chat_client import ChatClient
+from .codec import JSONCodec, get_codec
+from .dedup import MessageDeduplicator
+from .enums import ChatType
+from .executor import EventExecutor
+from .profile_cache import ProfileCache
+from .reconnect import ReconnectPolicy
+from .registry import MessageType
+from .shedding import LoadSheddingPolicy
+from .gateway import ChzzkWebSocket
+from .http import ChzzkChatSession
+from ..client import Client
+from ..connection_pool import ConnectionPool
+from ..http import ChzzkAPISession
+from ..response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    from .message import Message
+
+_log = logging.getLogger(__name__)
+
+
+class HubChatClient(ChatClient):
+    """Represents a chat channel owned by :class:`ChatHub`.
+    The sessions of this client are borrowed from the hub.
+    """
+
+    def __init__(
+        self,
+        hub: ChatHub,
+        channel_id: str,
+        chat_channel_id: Optional[str] = None,
+    ):
+        self.hub = hub
+        super().__init__(
+            channel_id=channel_id,
+            chat_channel_id=chat_channel_id,
+            loop=hub.loop,
+            codec=hub.codec,
+            lazy_parsing=hub.lazy_parsing,
+            event_executor=hub.event_executor,
+            load_shedding=hub.load_shedding,
+            reconnect_policy=hub.reconnect_policy,
+            heartbeat_interval=hub.heartbeat_interval,
+            max_missed_heartbeats=hub.max_missed_heartbeats,
+            chat_server_url=hub.chat_server_url,
+            deduplicator=hub.deduplicator,
+            profile_cache=hub.profile_cache,
+            raw_records=hub.raw_records,
+            response_cache=hub.response_cache,
+            connection_pool=hub.connection_pool,
+        )
+        self.user_id = hub.user_id
+        self._connection.message_types.update(hub._message_types)
+
+    def _session_initial_set(self):
+        self._api_session = self.hub._api_session
+        self._game_session = self.hub._game_session
+        self.ws_session = self.hub.ws_session
+
+    async def _create_gateway(self, session_id: Optional[str] = None) -> ChzzkWebSocket:
+        server_id = ChzzkWebSocket.server_id(self.chat_channel_id)
+        async with self.hub._server_semaphore(server_id):
+            return await super()._create_gateway(session_id=session_id)
+
+    async def close(self):
+        """Close the connection of this channel. The shared sessions and event executor stay open."""
+        self._closed = True
+        await self._close_connection()
+
+    def is_observed(self, event: str) -> bool:
+        return super().is_observed(event) or self.hub.is_observed(event)
+
+    def _dispatch_handlers(self, event: str, *args: Any, **kwargs) -> None:
+        super()._dispatch_handlers(event, *args, **kwargs)
+        self.hub._dispatch_from(self, event, *args, **kwargs)
+
+
+class ChatHub(Client):
+    """Represents a client that connects many chat channels of Chzzk in one event loop.
+    All channels share a websocket session, REST sessions and the access-token fetching.
+    """
+
+    def __init__(
+        self,
+        authorization_key: Optional[str] = None,
+        session_key: Optional[str] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        max_concurrent_connect: int = 4,
+        codec: Optional[JSONCodec] = None,
+        lazy_parsing: bool = False,
+        event_executor: Optional[EventExecutor] = None,
+        load_shedding: Optional[LoadSheddingPolicy] = None,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        heartbeat_interval: Optional[float] = 5.0,
+        max_missed_heartbeats: int = 2,
+        chat_server_url: Optional[str] = None,
+        deduplicator: Optional[MessageDeduplicator] = None,
+        profile_cache: Optional[ProfileCache] = None,
+        raw_records: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+    ):
+        super().__init__(
+            loop=loop,
+            authorization_key=authorization_key,
+            session_key=session_key,
+            response_cache=response_cache,
+            connection_pool=connection_pool,
+        )
+
+        self.user_id: Optional[str] = None
+        self.codec: JSONCodec = codec or get_codec()
+        self.lazy_parsing = lazy_parsing
+        self.event_executor = event_executor
+        self.load_shedding = load_shedding
+        self.reconnect_policy = reconnect_policy
+        self.heartbeat_interval = heartbeat_interval
+        self.max_missed_heartbeats = max_missed_heartbeats
+        self.chat_server_url = chat_server_url
+        self.deduplicator = deduplicator
+        self.profile_cache = profile_cache
+        self.raw_records = raw_records
+        self.max_concurrent_connect = max_concurrent_connect
+
+        self._clients: dict[str, HubChatClient] = dict()
+        self._tasks: dict[str, asyncio.Task] = dict()
+        self._semaphores: dict[int, asyncio.Semaphore] = dict()
+        self._message_types: dict[int, MessageType] = dict()
+        self._extra_event: dict[str, list[Callable[..., Coroutine[Any, Any, Any]]]] = (
+            dict()
+        )
+
+        self._running = False
+        self._stopped = asyncio.Event()
+
+    def _session_initial_set(self):
+        session_options = self.connection_pool.session_options(self.loop)
+        self._api_session = ChzzkAPISession(loop=self.loop, **session_options)
+        self._game_session = ChzzkChatSession(loop=self.loop, **session_options)
+        self.ws_session = aiohttp.ClientSession(loop=self.loop, **session_options)
+
+    def _server_semaphore(self, server_id: int) -> asyncio.Semaphore:
+        if server_id not in self._semaphores.keys():
+            self._semaphores[server_id] = asyncio.Semaphore(self.max_concurrent_connect)
+        return self._semaphores[server_id]
+
+    @property
+    def channels(self) -> list[HubChatClient]:
+        """A list of channels that the hub owns."""
+        return list(self._clients.values())
+
+    @property
+    def shards(self) -> dict[int, list[HubChatClient]]:
+        """Channels grouped by the chat server (`kr-ss{server_id}`) they are connected to.
+        Channels that have not resolved a chat channel ID yet are not included."""
+        result: dict[int, list[HubChatClient]] = dict()
+        for client in self._clients.values():
+            if client.chat_channel_id is None:
+                continue
+            server_id = ChzzkWebSocket.server_id(client.chat_channel_id)
+            result.setdefault(server_id, list()).append(client)
+        return result
+
+    def get_channel(self, channel_id: str) -> Optional[HubChatClient]:
+        """Get a channel that the hub owns.
+
+        Parameters
+        ----------
+        channel_id : str
+            The channel ID of broadcaster
+
+        Returns
+        -------
+        Optional[HubChatClient]
+            The client of the channel. If the hub does not own the channel, returns None.
+        """
+        return self._clients.get(channel_id)
+
+    def register_message_type(
+        self, type_code: ChatType | int, model: type[Message], event: str
+    ) -> None:
+        """Register a model and an event for the type code of messages received by every channel of the hub.
+        It overrides the default (:func:`register_message_type`) without changing other clients.
+
+        Parameters
+        ----------
+        type_code : ChatType | int
+            The `msgTypeCode` of messages.
+        model : type[Message]
+            The model to validate messages.
+        event : str
+            The event name without `on_` prefix. (ex. `chat`)
+            Messages are dispatched to `on_{event}` and `on_{event}_batch`.
+        """
+        self._message_types[type_code] = MessageType(model, event)
+        for client in self._clients.values():
+            client.register_message_type(type_code, model, event)
+
+    def add_channel(
+        self, channel_id: str, chat_channel_id: Optional[str] = None
+    ) -> HubChatClient:
+        """Add a chat channel to the hub.
+        If the hub is already running, the channel connects immediately.
+
+        Parameters
+        ----------
+        channel_id : str
+            The channel ID of broadcaster
+        chat_channel_id : Optional[str]
+            The chat channel ID. If it is empty, it is fetched with `live_status` method.
+
+        Returns
+        -------
+        HubChatClient
+            The client of the channel.
+        """
+        if channel_id in self._clients.keys():
+            return self._clients[channel_id]
+
+        client = HubChatClient(
+            self, channel_id=channel_id, chat_channel_id=chat_channel_id
+        )
+        self._clients[channel_id] = client
+        if self._running:
+            self._start_channel(client)
+        return client
+
+    async def remove_channel(self, channel_id: str) -> None:
+        """Disconnect a chat channel and remove it from the hub.
+
+        Parameters
+        ----------
+        channel_id : str
+            The channel ID of broadcaster
+        """
+        client = self._clients.pop(channel_id, None)
+        if client is None:
+            return
+
+        await client.close()
+        task = self._tasks.pop(channel_id, None)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def _start_channel(self, client: HubChatClient) -> None:
+        task = self.loop.create_task(
+            self._run_channel(client), name=f"chzzk.py: hub {client.channel_id}"
+        )
+        self._tasks[client.channel_id] = task
+
+    async def _run_channel(self, client: HubChatClient) -> None:
+        try:
+            await client.connect()
+        except asyncio.CancelledError:
+            pass
+        except Exception as exc:
+            if client.is_closed:
+                return
+            _log.exception("Ignoring exception in channel %s", client.channel_id)
+            client.dispatch("client_error", exc)
+        finally:
+            self._tasks.pop(client.channel_id, None)
+
+    def run(self, authorization_key: str = None, session_key: str = None) -> None:
+        wrapper = self.start(authorization_key, session_key)
+        try:
+            self.loop.run_until_complete(wrapper)
+        except KeyboardInterrupt:
+            return
+
+    async def start(self, authorization_key: str = None, session_key: str = None):
+        try:
+            if authorization_key is not None and session_key is not None:
+                self.login(authorization_key=authorization_key, session_key=session_key)
+            await self.connect()
+        finally:
+            await self.close()
+
+    async def connect(self) -> None:
+        """Connect all channels of the hub and wait until the hub is closed."""
+        if self._game_session.has_login and self.user_id is None:
+            user = await self.user()
+            self.user_id = user.user_id_hash
+            for client in self._clients.values():
+                client.user_id = self.user_id
+
+        self._running = True
+        for client in self._clients.values():
+            if client.channel_id not in self._tasks.keys():
+                self._start_channel(client)
+        await self._stopped.wait()
+
+    async def close(self):
+        """Close the connection of all channels and the shared sessions."""
+        self._running = False
+        # Channels can be removed while closing, so the snapshot is iterated.
+        for client in list(self._clients.values()):
+            await client.close()
+        for task in list(self._tasks.values()):
+            task.cancel()
+        if self.event_executor is not None:
+            await self.event_executor.close()
+
+        await self.ws_session.close()
+        await super().close()
+        self._stopped.set()
+
+    # Event Handler
+    def event(
+        self, coro: Callable[..., Coroutine[Any, Any, Any]]
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        """A decorator that registers an event to listen to on every channel.
+        The function must be corutine. Else client cause TypeError
+
+        The events are same as :meth:`ChatClient.event`,
+        but the channel ID is passed as the first argument.
+
+        Example
+        -------
+        >>> @hub.event
+        ... async def on_chat(channel_id: str, message: ChatMessage):
+        ...     print(channel_id, message.content)
+        """
+        if not asyncio.iscoroutinefunction(coro):
+            raise TypeError("function must be a coroutine.")
+
+        event_name = coro.__name__
+        if event_name not in self._extra_event.keys():
+            self._extra_event[event_name] = list()
+        self._extra_event[event_name].append(coro)
+        return coro
+
+    def is_observed(self, event: str) -> bool:
+        """Check whether a hub event handler waits for the event.
+
+        Parameters
+        ----------
+        event : str
+            The event name without `on_` prefix. (ex. `chat`)
+        """
+        return len(self._extra_event.get("on_" + event, list())) > 0
+
+    def _dispatch_from(
+        self, client: HubChatClient, event: str, *args: Any, **kwargs
+    ) -> None:
+        method = "on_" + event
+        if method not in self._extra_event.keys():
+            return
+
+        for coroutine_function in self._extra_event[method]:
+            client._schedule_event(
+                coroutine_function, method, client.channel_id, *args, **kwargs
+            )
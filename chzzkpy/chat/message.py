@@ -26,7 +26,7 @@ from __future__ import annotations
 import datetime
 import functools
 from typing import Optional, Literal, TypeVar, Generic, TYPE_CHECKING, Any
-from pydantic import AliasChoices, Field, Json, ConfigDict
+from pydantic import AliasChoices, Field, Json, ConfigDict, TypeAdapter
 
 from .donation import BaseDonation, ChatDonation, VideoDonation, MissionDonation
 from .enums import ChatType
@@ -34,10 +34,14 @@ from .profile import Profile
 from ..base_model import ChzzkModel
 
 if TYPE_CHECKING:
+    from typing_extensions import Self
+
     from .chat_client import ChatClient
 
 E = TypeVar("E", bound="ExtraBase | BaseDonation")
 
+_LAZY_FIELDS = ("profile", "extras")
+
 
 class ExtraBase(ChzzkModel):
     pass
@@ -57,8 +61,10 @@ class Message(ChzzkModel, Generic[E]):
 
     profile: Optional[Json[Profile]]
     content: str = Field(validation_alias=AliasChoices("msg", "content"))
-    type: ChatType = Field(
-        validation_alias=AliasChoices("msgTypeCode", "messageTypeCode")
+    # The type code not in ChatType is kept as int. (ex. registered with `register_message_type`)
+    type: ChatType | int = Field(
+        validation_alias=AliasChoices("msgTypeCode", "messageTypeCode"),
+        union_mode="left_to_right",
     )
     extras: Optional[Json[E]]
 
@@ -72,6 +78,75 @@ class Message(ChzzkModel, Generic[E]):
         validation_alias=AliasChoices("msgTime", "messageTime")
     )
 
+    @classmethod
+    def model_validate_lazy(cls, obj: dict[str, Any]) -> Self:
+        """Validate a message, except `profile` and `extras` fields.
+        The raw JSON of these fields is validated when it is accessed first.
+        Comparing, printing or dumping the message also validates them,
+        so a lazy message behaves the same as a message validated at once."""
+        deferred = {key: obj.get(key) for key in _LAZY_FIELDS}
+        model = cls.model_validate({**obj, **dict.fromkeys(_LAZY_FIELDS)})
+        for key, value in deferred.items():
+            if value is not None:
+                model.__dict__[key] = value
+        return model
+
+    def _resolve_lazy_fields(self) -> None:
+        for key in _LAZY_FIELDS:
+            getattr(self, key)
+
+    def __eq__(self, other: Any) -> bool:
+        self._resolve_lazy_fields()
+        if isinstance(other, Message):
+            other._resolve_lazy_fields()
+        return super().__eq__(other)
+
+    def __repr_args__(self):
+        self._resolve_lazy_fields()
+        return super().__repr_args__()
+
+    def model_dump(self, **kwargs) -> dict[str, Any]:
+        self._resolve_lazy_fields()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        self._resolve_lazy_fields()
+        return super().model_dump_json(**kwargs)
+
+
+class _LazyJsonField:
+    """A descriptor that validates the raw JSON of a field at the first access.
+    The validated value replaces the raw JSON, so it is validated only once."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._adapters: dict[type[Message], TypeAdapter] = dict()
+
+    def _adapter(self, owner: type[Message]) -> TypeAdapter:
+        if owner not in self._adapters.keys():
+            annotation = owner.model_fields[self.name].annotation
+            self._adapters[owner] = TypeAdapter(annotation)
+        return self._adapters[owner]
+
+    def __get__(self, instance: Optional[Message], owner: type[Message]) -> Any:
+        if instance is None:
+            # Hide the descriptor from a field collection of pydantic.
+            raise AttributeError(self.name)
+
+        value = instance.__dict__.get(self.name)
+        if isinstance(value, str):
+            value = self._adapter(owner).validate_python(value)
+            instance.__dict__[self.name] = value
+        return value
+
+    def __set__(self, instance: Message, value: Any) -> None:
+        instance.__dict__[self.name] = value
+
+
+# A message validated at once already holds the validated values, so the descriptor only returns them.
+for _field_name in _LAZY_FIELDS:
+    setattr(Message, _field_name, _LazyJsonField(_field_name))
+
 
 class MessageDetail(Message[E], Generic[E]):
     member_count: int = Field(validation_alias=AliasChoices("mbrCnt", "memberCount"))
@@ -96,9 +171,12 @@ class ChatMessage(MessageDetail[Extra]):
 
     @classmethod
     def model_validate_with_client(
-        cls: type[ChatMessage], obj: Any, client: ChatClient
+        cls: type[ChatMessage], obj: Any, client: ChatClient, lazy: bool = False
     ) -> ChatMessage:
-        model = super().model_validate(obj)
+        if lazy:
+            model = cls.model_validate_lazy(obj)
+        else:
+            model = super().model_validate(obj)
         model.client = client
         return model
 
@@ -144,6 +222,29 @@ class ChatMessage(MessageDetail[Extra]):
         return self.client.user_id == self.user_id
 
 
+class MediaExtra(ExtraBase):
+    chat_type: Optional[str] = None
+    emojis: Optional[Any] = None
+    os_type: Optional[Literal["PC", "AOS", "IOS"]] = None
+    streaming_channel_id: Optional[str] = None
+
+
+class ImageMessage(ChatMessage):
+    extras: Optional[Json[MediaExtra]]
+
+
+class StickerMessage(ChatMessage):
+    extras: Optional[Json[MediaExtra]]
+
+
+class VideoMessage(ChatMessage):
+    extras: Optional[Json[MediaExtra]]
+
+
+class RichMessage(ChatMessage):
+    extras: Optional[Json[MediaExtra]]
+
+
 class NoticeExtra(Extra):
     register_profile: Profile
 
@@ -197,3 +298,7 @@ class SystemExtra(ExtraBase):
 
 class SystemMessage(MessageDetail[SystemExtra]):
     pass
+
+
+class OpenMessage(Message[ExtraBase]):
+    pass
@@ -21,6 +21,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import functools
 from typing import Any, Optional
 from pydantic import computed_field, Field, PrivateAttr
 
@@ -52,7 +53,7 @@ class StreamingProperty(ChzzkModel):
         return self._following_dt["followDate"]
 
     @computed_field
-    @property
+    @functools.cached_property
     def donation_ranking_badge(self) -> Optional[Badge]:
         if (
             self._real_time_donation_ranking_dt is None
@@ -94,12 +95,12 @@ class Profile(ChzzkModel):
         return self._title["color"]
 
     @computed_field
-    @property
+    @functools.cached_property
     def badge(self) -> Optional[Badge]:
         if self._badge is None and self._title is None:
             return
         _badge = self._badge or dict()
         _title = self._title or dict()
-        return Badge(
-            name=_title.get("name", None), image_url=_badge.get("imageUrl", None)
+        return Badge.model_validate(
+            {"name": _title.get("name", None), "imageUrl": _badge.get("imageUrl", None)}
         )
@@ -0,0 +1,98 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from typing import Any, Optional
+
+from .codec import JSONCodec, get_codec
+from .profile import Profile
+
+
+def _intern(value: Any) -> Any:
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(key): _intern(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_intern(item) for item in value]
+    return value
+
+
+class ProfileCache:
+    """Represents a bounded LRU that maps the raw JSON of profile to a shared :class:`Profile`.
+    A user sends many messages with the same profile, so the profile is validated once per user.
+    Strings of profiles (ex. nickname, URL of badges) are interned to share them between profiles.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum number of cached profiles, by default 5000
+    codec : Optional[JSONCodec]
+        The codec to deserialize the raw JSON. By default, the fastest installed codec.
+    """
+
+    def __init__(self, max_size: int = 5000, codec: Optional[JSONCodec] = None):
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0.")
+
+        self.max_size = max_size
+        self.codec: JSONCodec = codec or get_codec()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self._profiles: OrderedDict[str, Profile] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """The metrics of profile cache. (size, hits, misses)"""
+        return {"size": len(self._profiles), "hits": self.hits, "misses": self.misses}
+
+    def get(self, raw: str) -> Profile:
+        """Get the profile of the raw JSON. The profile is validated, if it is not cached.
+
+        Parameters
+        ----------
+        raw : str
+            The raw JSON of profile in a message.
+        """
+        profile = self._profiles.get(raw)
+        if profile is not None:
+            self._profiles.move_to_end(raw)
+            self.hits += 1
+            return profile
+
+        profile = Profile.model_validate(_intern(self.codec.loads(raw)))
+        self._profiles[raw] = profile
+        if len(self._profiles) > self.max_size:
+            self._profiles.popitem(last=False)
+        self.misses += 1
+        return profile
+
+    def clear(self) -> None:
+        self._profiles.clear()
@@ -0,0 +1,91 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Optional
+
+
+class ReconnectPolicy:
+    """Represents a policy to reconnect the websocket of chat.
+    The delay grows exponentially with each failed attempt, and it is randomized with jitter
+    to avoid that many clients reconnect at the same moment.
+
+    Parameters
+    ----------
+    initial_delay : float
+        The delay in seconds before the first attempt, by default 1.0
+    max_delay : float
+        The maximum delay in seconds, by default 60.0
+    factor : float
+        The multiplier of delay for each failed attempt, by default 2.0
+    jitter : float
+        The ratio of delay that is randomized, between 0.0 (no jitter) and 1.0, by default 0.5
+    max_attempts : Optional[int]
+        The maximum number of consecutive attempts. If it is empty, the client tries forever.
+    backfill_count : int
+        The number of recent chats requested after reconnecting to recover missed messages.
+        Set 0 to disable backfill, by default 50
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+        factor: float = 2.0,
+        jitter: float = 0.5,
+        max_attempts: Optional[int] = None,
+        backfill_count: int = 50,
+    ):
+        if not 0.0 <= jitter <= 1.0:
+            raise ValueError("jitter must be in [0.0, 1.0].")
+
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+        self.backfill_count = backfill_count
+
+    def can_retry(self, attempt: int) -> bool:
+        """Check whether the attempt is allowed.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of consecutive attempts, starting from 1.
+        """
+        return self.max_attempts is None or attempt <= self.max_attempts
+
+    def delay(self, attempt: int) -> float:
+        """Get the delay in seconds before the attempt.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of consecutive attempts, starting from 1.
+        """
+        exponent = min(attempt - 1, 64)  # prevent OverflowError
+        delay = min(self.max_delay, self.initial_delay * self.factor**exponent)
+        return delay - random.uniform(0.0, delay * self.jitter)
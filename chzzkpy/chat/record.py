@@ -0,0 +1,137 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from .enums import ChatType
+
+
+class ChatRecord:
+    """Represents a compact record of a message for analytics.
+    It is made from the raw message without validation, so it is much lighter than :class:`Message`.
+
+    Attributes
+    ----------
+    channel_id : str
+        The chat channel ID.
+    user_id : str
+        The user ID hash of sender.
+    nickname : Optional[str]
+        The nickname of sender.
+    type : int
+        The type code of message. (:class:`ChatType`)
+    content : str
+        The content of message.
+    time : int
+        The time that the message is sent, in epoch milliseconds.
+    pay_amount : Optional[int]
+        The amount of donation. If the message is not a donation, it is None.
+    """
+
+    __slots__ = (
+        "channel_id",
+        "user_id",
+        "nickname",
+        "type",
+        "content",
+        "time",
+        "pay_amount",
+    )
+
+    def __init__(
+        self,
+        channel_id: str,
+        user_id: str,
+        nickname: Optional[str],
+        type: int,
+        content: str,
+        time: int,
+        pay_amount: Optional[int] = None,
+    ):
+        self.channel_id = channel_id
+        self.user_id = user_id
+        self.nickname = nickname
+        self.type = type
+        self.content = content
+        self.time = time
+        self.pay_amount = pay_amount
+
+    def __repr__(self) -> str:
+        attributes = " ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"<ChatRecord {attributes}>"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ChatRecord):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    def to_tuple(self) -> tuple[Any, ...]:
+        """Get the values in order of the attributes. (ex. for a row of database)"""
+        return tuple(getattr(self, key) for key in self.__slots__)
+
+    @classmethod
+    def from_message(
+        cls,
+        message: dict[str, Any],
+        loads: Callable[[str], Any],
+        nicknames: Optional[dict[str, Optional[str]]] = None,
+    ) -> ChatRecord:
+        """Make a record from the raw message of CHAT or RECENT_CHAT.
+
+        Parameters
+        ----------
+        message : dict[str, Any]
+            The raw message.
+        loads : Callable[[str], Any]
+            The function to deserialize the raw JSON of `profile` and `extras`.
+        nicknames : Optional[dict[str, Optional[str]]]
+            The cache of nicknames by the raw JSON of profile.
+        """
+        raw_profile = message.get("profile")
+        nickname = None
+        if raw_profile:
+            if nicknames is not None and raw_profile in nicknames:
+                nickname = nicknames[raw_profile]
+            else:
+                nickname = (loads(raw_profile) or dict()).get("nickname")
+                if nicknames is not None:
+                    nicknames[raw_profile] = nickname
+
+        message_type = message.get("msgTypeCode") or message.get("messageTypeCode")
+        pay_amount = None
+        if message_type == ChatType.DONATION:
+            raw_extras = message.get("extras")
+            if raw_extras:
+                pay_amount = loads(raw_extras).get("payAmount")
+
+        return cls(
+            channel_id=message.get("cid") or message.get("channelId"),
+            user_id=message.get("uid") or message.get("userId"),
+            nickname=nickname,
+            type=message_type,
+            content=message.get("msg") or message.get("content"),
+            time=message.get("msgTime") or message.get("messageTime"),
+            pay_amount=pay_amount,
+        )
@@ -0,0 +1,192 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import time
+from typing import Any, Iterator, NamedTuple, Optional, TYPE_CHECKING
+
+from .enums import ChatCmd, get_enum
+
+if TYPE_CHECKING:
+    from .chat_client import ChatClient
+
+
+class FrameRecorder:
+    """Represents a recorder that appends raw frames of the websocket to a gzip-compressed file.
+    Each line of the file is the received time (UNIX timestamp) and the raw frame separated by a tab.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The path of recording file. If the file exists, frames are appended.
+    compresslevel : int
+        The compression level of gzip, by default 6
+    """
+
+    def __init__(self, path: str | os.PathLike, compresslevel: int = 6):
+        self.path = path
+        self.frames: int = 0
+        self._file = gzip.open(
+            path, "at", encoding="utf-8", compresslevel=compresslevel
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def record(self, data: str, received_time: Optional[float] = None) -> None:
+        """Append a raw frame.
+
+        Parameters
+        ----------
+        data : str
+            The raw frame received from the websocket.
+        received_time : Optional[float]
+            The UNIX timestamp when the frame is received. If it is empty, the current time is used.
+        """
+        if received_time is None:
+            received_time = time.time()
+        # JSON escapes tab and newline in a string, so that they split the fields safely.
+        self._file.write(f"{received_time:.6f}\t{data}\n")
+        self.frames += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class ReplayResult(NamedTuple):
+    frames: int
+    messages: int
+    elapsed: float
+    p50: float
+    p99: float
+
+    @property
+    def messages_per_second(self) -> float:
+        if self.elapsed == 0.0:
+            return 0.0
+        return self.messages / self.elapsed
+
+
+class FrameReplayer:
+    """Represents a replayer that feeds a recording of :class:`FrameRecorder` to a client.
+    Frames are parsed by :class:`ConnectionState` and dispatched to the event handlers of the client,
+    without connecting to the server.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The path of recording file.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = path
+
+    def frames(self) -> Iterator[tuple[float, str]]:
+        """Iterate the received time and the raw frame of recording."""
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            for line in file:
+                received_time, _, data = line.rstrip("\n").partition("\t")
+                yield float(received_time), data
+
+    async def replay(
+        self, client: ChatClient, speed: Optional[float] = None
+    ) -> ReplayResult:
+        """Replay the recording to the client.
+
+        Parameters
+        ----------
+        client : ChatClient
+            The client to dispatch events.
+        speed : Optional[float]
+            The speed of replay in comparison with the recording. (ex. 1.0 is real-time)
+            If it is empty, frames are replayed as fast as possible.
+
+        Returns
+        -------
+        ReplayResult
+            The number of frames and messages, the elapsed time,
+            and the 50th and 99th percentile of time in seconds to parse and dispatch a frame.
+        """
+        parsers = client._connection.parsers
+        frame_times: list[float] = list()
+        messages = 0
+
+        first_received_time: Optional[float] = None
+        started_at = time.perf_counter()
+        for received_time, raw in self.frames():
+            if speed is not None:
+                if first_received_time is None:
+                    first_received_time = received_time
+                delay = (received_time - first_received_time) / speed - (
+                    time.perf_counter() - started_at
+                )
+                if delay > 0.0:
+                    await asyncio.sleep(delay)
+
+            frame_started_at = time.perf_counter()
+            data = client.codec.loads(raw)
+            parser = parsers.get(get_enum(ChatCmd, data["cmd"]))
+            if parser is None:
+                continue
+            body = data.get("bdy")
+            parser(body)
+            frame_times.append(time.perf_counter() - frame_started_at)
+            messages += _count_messages(body)
+
+            # Let scheduled event handlers run.
+            await asyncio.sleep(0)
+        elapsed = time.perf_counter() - started_at
+
+        frame_times.sort()
+        return ReplayResult(
+            frames=len(frame_times),
+            messages=messages,
+            elapsed=elapsed,
+            p50=_percentile(frame_times, 0.5),
+            p99=_percentile(frame_times, 0.99),
+        )
+
+
+def _count_messages(body: Any) -> int:
+    if isinstance(body, list):
+        return len(body)
+    if isinstance(body, dict) and "messageList" in body:
+        return len(body["messageList"])
+    return 1
+
+
+def _percentile(values: list[float], ratio: float) -> float:
+    if len(values) == 0:
+        return 0.0
+    return values[int((len(values) - 1) * ratio)]
@@ -0,0 +1,84 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple, Optional
+
+from .enums import ChatType
+from .message import (
+    Message,
+    ChatMessage,
+    DonationMessage,
+    ImageMessage,
+    OpenMessage,
+    RichMessage,
+    StickerMessage,
+    SubscriptionMessage,
+    SystemMessage,
+    VideoMessage,
+)
+
+
+class MessageType(NamedTuple):
+    model: type[Message]
+    event: str
+
+
+# The default registry. Each client copies it when the client is created.
+MESSAGE_TYPES: dict[int, MessageType] = {
+    ChatType.TEXT: MessageType(ChatMessage, "chat"),
+    ChatType.IMAGE: MessageType(ImageMessage, "image"),
+    ChatType.STICKER: MessageType(StickerMessage, "sticker"),
+    ChatType.VIDEO: MessageType(VideoMessage, "video"),
+    ChatType.RICH: MessageType(RichMessage, "rich"),
+    ChatType.DONATION: MessageType(DonationMessage, "donation"),
+    ChatType.SUBSCRIPTION: MessageType(SubscriptionMessage, "subscription"),
+    ChatType.SYSTEM_MESSAGE: MessageType(SystemMessage, "system_message"),
+    ChatType.OPEN: MessageType(OpenMessage, "open"),
+}
+
+
+def register_message_type(
+    type_code: ChatType | int, model: type[Message], event: str
+) -> None:
+    """Register a default model and event for the type code of messages.
+    The defaults are shared by the process, and they are copied to clients created after.
+    To register a type only for a client, use :meth:`ChatClient.register_message_type`.
+
+    Parameters
+    ----------
+    type_code : ChatType | int
+        The `msgTypeCode` of messages.
+    model : type[Message]
+        The model to validate messages.
+    event : str
+        The event name without `on_` prefix. (ex. `chat`)
+        Messages are dispatched to `on_{event}` and `on_{event}_batch`.
+    """
+    MESSAGE_TYPES[type_code] = MessageType(model, event)
+
+
+def get_message_type(type_code: ChatType | int) -> Optional[MessageType]:
+    """Get the default model and event registered for the type code of messages."""
+    return MESSAGE_TYPES.get(type_code)
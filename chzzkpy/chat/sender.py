@@ -0,0 +1,312 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from typing import Optional, TYPE_CHECKING
+
+from .error import ChatRestricted
+
+if TYPE_CHECKING:
+    from .chat_client import ChatClient
+    from .message import ChatMessage
+
+_log = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Represents a token bucket to limit the rate of sending chats.
+    A token is refilled at `rate` per second, and a chat consumes a token.
+
+    Parameters
+    ----------
+    rate : float
+        The number of tokens refilled per second, by default 1.0
+    capacity : int
+        The maximum number of tokens, which is the size of a burst, by default 3
+    """
+
+    def __init__(self, rate: float = 1.0, capacity: int = 3):
+        if rate <= 0.0:
+            raise ValueError("rate must be greater than 0.")
+        if capacity < 1:
+            raise ValueError("capacity must be greater than 0.")
+
+        self.rate = rate
+        self.capacity = capacity
+
+        self._tokens: float = float(capacity)
+        self._updated_at: float = time.monotonic()
+        self._blocked_until: float = 0.0
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens available now."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def block(self, seconds: float) -> None:
+        """Block the bucket for `seconds`. It is used when the user is temporarily restricted."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def delay(self) -> float:
+        """Get the delay in seconds until a token can be consumed."""
+        self._refill()
+        blocked = self._blocked_until - time.monotonic()
+        if self._tokens >= 1.0:
+            return max(0.0, blocked)
+        return max(blocked, (1.0 - self._tokens) / self.rate)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        while (delay := self.delay()) > 0.0:
+            await asyncio.sleep(delay)
+        self._tokens -= 1.0
+
+
+class ChatSender:
+    """Represents an outbound queue of chats.
+    Chats are sent in order within the rate of :class:`TokenBucket`,
+    and each future is resolved when the server echoes the chat.
+
+    Parameters
+    ----------
+    client : ChatClient
+        The client to send chats.
+    rate_limit : Optional[TokenBucket]
+        The token bucket to limit the rate of sending chats.
+    timeout : float
+        The time in seconds to wait for the echo of a sent chat, by default 10.0
+    """
+
+    def __init__(
+        self,
+        client: ChatClient,
+        rate_limit: Optional[TokenBucket] = None,
+        timeout: float = 10.0,
+    ):
+        self.client = client
+        self.rate_limit: TokenBucket = rate_limit or TokenBucket()
+        self.timeout = timeout
+
+        self.sent: int = 0
+        self.acknowledged: int = 0
+        self.timed_out: int = 0
+        self.latencies: deque[float] = deque(maxlen=100)
+
+        # The tid 1 and 2 are used by CONNECT and REQUEST_RECENT_CHAT.
+        self._tid = itertools.count(3)
+        self._queue: deque[tuple[str, asyncio.Future[ChatMessage]]] = deque()
+        self._wakeup = asyncio.Event()
+        self._pending: dict[
+            tuple[str, str], deque[tuple[asyncio.Future[ChatMessage], float]]
+        ] = dict()
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of chats waiting to be sent."""
+        return len(self._queue)
+
+    @property
+    def pending(self) -> int:
+        """The number of sent chats waiting for the echo."""
+        return sum(len(x) for x in self._pending.values())
+
+    @property
+    def metrics(self) -> dict[str, int | float]:
+        """The metrics of the outbound queue.
+        (queue_depth, pending, sent, acknowledged, timed_out, latency_p50, latency_p99)
+        """
+        latencies = sorted(self.latencies)
+        if len(latencies) > 0:
+            latency_p50 = latencies[int((len(latencies) - 1) * 0.5)]
+            latency_p99 = latencies[int((len(latencies) - 1) * 0.99)]
+        else:
+            latency_p50 = latency_p99 = 0.0
+        return {
+            "queue_depth": self.queue_depth,
+            "pending": self.pending,
+            "sent": self.sent,
+            "acknowledged": self.acknowledged,
+            "timed_out": self.timed_out,
+            "latency_p50": latency_p50,
+            "latency_p99": latency_p99,
+        }
+
+    def submit(self, message: str) -> asyncio.Future[ChatMessage]:
+        """Put a chat into the queue.
+
+        Parameters
+        ----------
+        message : str
+            The chat to send.
+
+        Returns
+        -------
+        asyncio.Future[ChatMessage]
+            The future resolved with the echoed chat.
+            It fails with :exc:`asyncio.TimeoutError` when the echo does not arrive in time.
+        """
+        future: asyncio.Future[ChatMessage] = self.client.loop.create_future()
+        # The exception of a future nobody awaits is retrieved to avoid the warning.
+        future.add_done_callback(_retrieve_exception)
+
+        self._queue.append((message, future))
+        self._wakeup.set()
+        if self._worker is None or self._worker.done():
+            self._worker = self.client.loop.create_task(
+                self._run(), name="chzzk.py: chat sender"
+            )
+        return future
+
+    def is_pending(self, user_id: Optional[str], content: Optional[str]) -> bool:
+        """Check whether a sent chat of the user and the content waits for the echo."""
+        return (user_id, content) in self._pending
+
+    def acknowledge(self, message: ChatMessage) -> None:
+        """Resolve the future of a sent chat with the echoed chat."""
+        if len(self._pending) == 0:
+            return
+
+        key = (message.user_id, message.content)
+        pending = self._pending.get(key)
+        if pending is None:
+            return
+
+        future, sent_at = pending.popleft()
+        if len(pending) == 0:
+            self._pending.pop(key)
+
+        if not future.done():
+            self.acknowledged += 1
+            self.latencies.append(time.perf_counter() - sent_at)
+            future.set_result(message)
+
+    def close(self) -> None:
+        """Stop sending chats, and cancel the futures not resolved."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+        for _, future in self._queue:
+            future.cancel()
+        for pending in self._pending.values():
+            for future, _ in pending:
+                future.cancel()
+        self._queue.clear()
+        self._pending.clear()
+
+    async def _run(self) -> None:
+        while True:
+            if len(self._queue) == 0:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            await self.client.wait_until_connected()
+            try:
+                self._check_restrict()
+            except ChatRestricted as error:
+                for _, future in self._queue:
+                    if not future.done():
+                        future.set_exception(error)
+                self._queue.clear()
+                continue
+            await self.rate_limit.acquire()
+
+            message, future = self._queue.popleft()
+            if future.done():  # cancelled by the caller
+                continue
+            await self._send(message, future)
+
+    def _check_restrict(self) -> None:
+        access_token = self.client.access_token
+        if access_token is None:
+            return
+
+        restrict = access_token.temporary_restrict
+        if not restrict.temporary_restrict:
+            return
+
+        if restrict.created_time is None or restrict.duration is None:
+            raise ChatRestricted(restrict.times)
+
+        remaining = restrict.created_time / 1000 + restrict.duration - time.time()
+        if remaining > 0.0:
+            _log.info("Sending chats is restricted for %.2f seconds", remaining)
+            self.rate_limit.block(remaining)
+
+    async def _send(self, message: str, future: asyncio.Future[ChatMessage]) -> None:
+        key = (self.client.user_id, message)
+        pending = self._pending.setdefault(key, deque())
+        pending.append((future, time.perf_counter()))
+
+        handle = self.client.loop.call_later(self.timeout, self._expire, key, future)
+        future.add_done_callback(lambda _: handle.cancel())
+
+        try:
+            await self.client._gateway.send_chat(
+                message, self.client.chat_channel_id, tid=next(self._tid)
+            )
+        except Exception as error:
+            self._discard(key, future)
+            if not future.done():
+                future.set_exception(error)
+            return
+        self.sent += 1
+
+    def _expire(self, key: tuple[str, str], future: asyncio.Future) -> None:
+        self._discard(key, future)
+        if not future.done():
+            self.timed_out += 1
+            future.set_exception(asyncio.TimeoutError())
+
+    def _discard(self, key: tuple[str, str], future: asyncio.Future) -> None:
+        pending = self._pending.get(key)
+        if pending is None:
+            return
+
+        for item in pending:
+            if item[0] is future:
+                pending.remove(item)
+                break
+        if len(pending) == 0:
+            self._pending.pop(key)
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
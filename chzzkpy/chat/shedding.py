@@ -0,0 +1,170 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import Optional
+
+from .enums import EventPriority
+
+EVENT_PRIORITIES: dict[str, EventPriority] = {
+    "chat": EventPriority.LOW,
+    "chat_batch": EventPriority.LOW,
+    "image": EventPriority.LOW,
+    "image_batch": EventPriority.LOW,
+    "sticker": EventPriority.LOW,
+    "sticker_batch": EventPriority.LOW,
+    "video": EventPriority.LOW,
+    "video_batch": EventPriority.LOW,
+    "rich": EventPriority.LOW,
+    "rich_batch": EventPriority.LOW,
+    "record": EventPriority.LOW,
+    "record_batch": EventPriority.LOW,
+    "system_message": EventPriority.NORMAL,
+    "system_message_batch": EventPriority.NORMAL,
+    "donation": EventPriority.HIGH,
+    "donation_batch": EventPriority.HIGH,
+    "subscription": EventPriority.HIGH,
+    "subscription_batch": EventPriority.HIGH,
+    "mission_completed": EventPriority.HIGH,
+    "mission_pending": EventPriority.HIGH,
+    "mission_approved": EventPriority.HIGH,
+    "mission_rejected": EventPriority.HIGH,
+    "connect": EventPriority.HIGH,
+    "disconnect": EventPriority.HIGH,
+    "recent_chat": EventPriority.HIGH,
+    "blind": EventPriority.HIGH,
+    "notice": EventPriority.HIGH,
+    "pin": EventPriority.HIGH,
+    "unpin": EventPriority.HIGH,
+    "shed": EventPriority.HIGH,
+    "error": EventPriority.HIGH,
+    "client_error": EventPriority.HIGH,
+}
+
+
+def get_event_priority(event: str) -> EventPriority:
+    """Get the priority of the event. Events not listed are NORMAL priority.
+
+    Parameters
+    ----------
+    event : str
+        The event name without `on_` prefix. (ex. `chat`)
+    """
+    return EVENT_PRIORITIES.get(event, EventPriority.NORMAL)
+
+
+class LoadSheddingPolicy:
+    """Represents a policy to shed events of low priority when event handlers fall behind.
+    The backlog is the number of pending event handlers.
+
+    * Below `low_watermark`, all events are delivered.
+    * From `low_watermark`, LOW priority events (chat) are sampled with `sample_rate`.
+    * From `high_watermark`, LOW priority events are shed,
+      and NORMAL priority events (system message) are sampled with `sample_rate`.
+    * HIGH priority events (donation, subscription, mission) are always delivered.
+
+    Parameters
+    ----------
+    low_watermark : int
+        The backlog to start sampling LOW priority events, by default 500
+    high_watermark : int
+        The backlog to start shedding LOW priority events, by default 2000
+    sample_rate : float
+        The ratio of events delivered while sampling, by default 0.1
+    report_interval : float
+        The minimum seconds between `on_shed` events, by default 5.0
+    """
+
+    def __init__(
+        self,
+        low_watermark: int = 500,
+        high_watermark: int = 2000,
+        sample_rate: float = 0.1,
+        report_interval: float = 5.0,
+    ):
+        if low_watermark > high_watermark:
+            raise ValueError("low_watermark must be less than high_watermark.")
+        if not 0.0 < sample_rate <= 1.0:
+            raise ValueError("sample_rate must be in (0.0, 1.0].")
+
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.sample_rate = sample_rate
+        self.report_interval = report_interval
+
+        self.shed: Counter[str] = Counter()
+
+        self._sample_interval = round(1 / sample_rate)
+        self._sample_counter: Counter[EventPriority] = Counter()
+        self._unreported: Counter[str] = Counter()
+        self._last_report: float = 0.0
+
+    @property
+    def shed_count(self) -> int:
+        """The total number of events shed."""
+        return sum(self.shed.values())
+
+    def _sampled_out(self, priority: EventPriority) -> bool:
+        self._sample_counter[priority] += 1
+        return self._sample_counter[priority] % self._sample_interval != 0
+
+    def should_shed(self, event: str, backlog: int) -> bool:
+        """Decide whether the event is shed, and count it if so.
+
+        Parameters
+        ----------
+        event : str
+            The event name without `on_` prefix. (ex. `chat`)
+        backlog : int
+            The number of pending event handlers.
+        """
+        priority = get_event_priority(event)
+        if priority == EventPriority.HIGH or backlog < self.low_watermark:
+            return False
+
+        if backlog < self.high_watermark:
+            result = priority == EventPriority.LOW and self._sampled_out(priority)
+        elif priority == EventPriority.LOW:
+            result = True
+        else:
+            result = self._sampled_out(priority)
+
+        if result:
+            self.shed[event] += 1
+            self._unreported[event] += 1
+        return result
+
+    def pop_report(self) -> Optional[dict[str, int]]:
+        """Get the number of events shed since the last report.
+        Returns None if the report interval has not passed."""
+        now = time.monotonic()
+        if len(self._unreported) == 0 or now - self._last_report < self.report_interval:
+            return None
+
+        report = dict(self._unreported)
+        self._unreported.clear()
+        self._last_report = now
+        return report
@@ -26,24 +26,30 @@ from __future__ import annotations
 import logging
 import inspect
 import functools
-from typing import Callable, Any, TYPE_CHECKING, Optional
+from collections import Counter
+from typing import Callable, Any, TYPE_CHECKING, Optional, TypeVar
 
 from .blind import Blind
+from .cache import MessageCache
+from .codec import get_codec
+from .dedup import MessageDeduplicator
 from .donation import MissionDonation
-from .enums import ChatCmd, ChatType, get_enum
-from .message import (
-    ChatMessage,
-    DonationMessage,
-    NoticeMessage,
-    SubscriptionMessage,
-    SystemMessage,
-)
+from .enums import ChatCmd
+from .frame import ChatFrame
+from .message import Message, ChatMessage, NoticeMessage
+from .profile import Profile
+from .profile_cache import ProfileCache
 from .recent_chat import RecentChat
+from .record import ChatRecord
+from .registry import MESSAGE_TYPES, MessageType
 
 if TYPE_CHECKING:
     from .chat_client import ChatClient
 
 log = logging.getLogger()
+M = TypeVar("M", bound=Message)
+
+_MAX_NICKNAMES = 10000
 
 
 class ConnectionState:
@@ -52,8 +58,34 @@ class ConnectionState:
         dispatch: Callable[..., Any],
         handler: dict[ChatCmd | int, Callable[..., Any]],
         client: Optional[ChatClient] = None,
+        lazy_parsing: bool = False,
+        is_observed: Optional[Callable[[str], bool]] = None,
+        deduplicator: Optional[MessageDeduplicator] = None,
+        message_cache: Optional[MessageCache] = None,
+        profile_cache: Optional[ProfileCache] = None,
+        raw_records: bool = False,
+        chat_frame: Optional[ChatFrame] = None,
     ):
         self.dispatch = dispatch
+        self.lazy_parsing = lazy_parsing
+        self.is_observed: Callable[[str], bool] = is_observed or (lambda _: True)
+        self.skipped_messages: Counter[str] = Counter()
+        self.deduplicator: Optional[MessageDeduplicator] = deduplicator
+        self.message_cache: Optional[MessageCache] = message_cache
+        self.profile_cache: Optional[ProfileCache] = profile_cache
+        self.message_types: dict[int, MessageType] = dict(MESSAGE_TYPES)
+
+        # Records without validation for analytics
+        self.raw_records = raw_records
+        self.chat_frame: Optional[ChatFrame] = chat_frame
+        self._nicknames: dict[str, Optional[str]] = dict()
+        self._loads = (client.codec if client is not None else get_codec()).loads
+
+        # Backfill of messages missed while reconnecting
+        self.backfill_pending: bool = False
+        self.backfilled_messages: int = 0
+        self._last_message_time: int = 0
+        self._last_message_keys: set[tuple[Optional[str], int]] = set()
         self.handler: dict[ChatCmd | int, Callable[..., Any]] = handler
         self.parsers: dict[ChatCmd, Callable[..., Any]] = dict()
         for _, func in inspect.getmembers(self):
@@ -93,36 +125,145 @@ class ConnectionState:
         self.call_handler(ChatCmd.CONNECTED)
         self.dispatch("connect")
 
+    def _validate_message(self, cls: type[M], data: dict[str, Any]) -> M:
+        profile: Optional[Profile] = None
+        if self.profile_cache is not None and isinstance(data.get("profile"), str):
+            profile = self.profile_cache.get(data["profile"])
+            data = {**data, "profile": None}
+
+        if issubclass(cls, ChatMessage):
+            model = cls.model_validate_with_client(
+                data, client=self.client, lazy=self.lazy_parsing
+            )
+        elif self.lazy_parsing:
+            model = cls.model_validate_lazy(data)
+        else:
+            model = cls.model_validate(data)
+
+        if profile is not None:
+            # The shared profile is set like the lazy fields, without validation.
+            model.__dict__["profile"] = profile
+        return model
+
+    @staticmethod
+    def _message_key(message: dict[str, Any]) -> tuple[Optional[str], int]:
+        message_time = message.get("msgTime") or message.get("messageTime") or 0
+        return message.get("uid") or message.get("userId"), message_time
+
+    def _remember_message(self, message: dict[str, Any]) -> None:
+        key = self._message_key(message)
+        _, message_time = key
+        if message_time > self._last_message_time:
+            self._last_message_time = message_time
+            self._last_message_keys = {key}
+        elif message_time == self._last_message_time:
+            self._last_message_keys.add(key)
+
+    def mark_received_until(self, message_time: int) -> None:
+        """Treat messages sent before the time (epoch milliseconds) as received.
+        It prevents backfilling messages sent before the first connection."""
+        if message_time > self._last_message_time:
+            self._last_message_time = message_time
+            self._last_message_keys = set()
+
+    def _is_received(self, message: dict[str, Any]) -> bool:
+        key = self._message_key(message)
+        _, message_time = key
+        return message_time < self._last_message_time or (
+            message_time == self._last_message_time and key in self._last_message_keys
+        )
+
     def _parse_all_type_of_chat(self, data: list[dict[str, Any]]):
         if data is None or len(data) == 0:
             return
 
+        if self.raw_records:
+            self._parse_records(data)
+            return
+
+        batches: dict[str, list[Message]] = dict()
         for message in data:
+            self._remember_message(message)
+            if self.deduplicator is not None and self.deduplicator.seen(message):
+                continue
+            if self.chat_frame is not None:
+                self.chat_frame.append_message(message, self._loads)
+
             message_raw_type = message.get("messageTypeCode") or message.get(
                 "msgTypeCode"
             )
-            message_type = get_enum(ChatType, message_raw_type)
+            message_type = self.message_types.get(message_raw_type)
+            if message_type is None:
+                log.debug("Unknown type of message: %s", message_raw_type)
+                continue
+            event_name = message_type.event
+
+            # Skip validation of the message that no one listens to.
+            observed = self.is_observed(event_name)
+            batch_observed = self.is_observed(event_name + "_batch")
+            if not observed and not batch_observed and self.message_cache is None:
+                self.skipped_messages[event_name] += 1
+                continue
 
             # Cause bug from insufficient information
             # ChatType: SYSTEM_MESSAGE
             if message.get("profile") == "{}":
                 message["profile"] = None
 
-            if message_type == ChatType.DONATION:
-                validated_data = DonationMessage.model_validate(message)
-                self.dispatch("donation", validated_data)
-            elif message_type == ChatType.SYSTEM_MESSAGE:
-
-                validated_data = SystemMessage.model_validate(message)
-                self.dispatch("system_message", validated_data)
-            elif message_type == ChatType.TEXT:
-                validated_data = ChatMessage.model_validate_with_client(
-                    message, client=self.client
-                )
-                self.dispatch("chat", validated_data)
-            elif message_type == ChatType.SUBSCRIPTION:
-                validated_data = SubscriptionMessage.model_validate(message)
-                self.dispatch("subscription", validated_data)
+            validated_data = self._validate_message(message_type.model, message)
+            if self.message_cache is not None:
+                self.message_cache.add(validated_data)
+
+            if observed:
+                self.dispatch(event_name, validated_data)
+            if batch_observed:
+                batches.setdefault(event_name, list()).append(validated_data)
+
+        # Messages of one frame are dispatched at once.
+        for event_name, messages in batches.items():
+            self.dispatch(event_name + "_batch", messages)
+
+    def _acknowledge_sent_chats(self, data: list[dict[str, Any]]):
+        # "chat" is not dispatched with raw records, so the echo of sent chats is validated here.
+        sender = self.client.sender
+        for message in data:
+            user_id = message.get("uid") or message.get("userId")
+            content = message.get("msg") or message.get("content")
+            if sender.is_pending(user_id, content):
+                sender.acknowledge(self._validate_message(ChatMessage, message))
+
+    def _parse_records(self, data: list[dict[str, Any]]):
+        if self.client is not None and self.client.sender.pending > 0:
+            self._acknowledge_sent_chats(data)
+
+        observed = self.is_observed("record")
+        batch_observed = self.is_observed("record_batch")
+        if not observed and not batch_observed and self.chat_frame is None:
+            self.skipped_messages["record"] += len(data)
+            for message in data:
+                self._remember_message(message)
+            return
+
+        if len(self._nicknames) > _MAX_NICKNAMES:
+            self._nicknames.clear()
+
+        records: list[ChatRecord] = list()
+        for message in data:
+            self._remember_message(message)
+            if self.deduplicator is not None and self.deduplicator.seen(message):
+                continue
+            if self.chat_frame is not None:
+                self.chat_frame.append_message(message, self._loads)
+            if not observed and not batch_observed:
+                continue
+
+            record = ChatRecord.from_message(message, self._loads, self._nicknames)
+            if observed:
+                self.dispatch("record", record)
+            records.append(record)
+
+        if batch_observed and len(records) > 0:
+            self.dispatch("record_batch", records)
 
     @parsable(ChatCmd.CHAT)
     @catch_exception
@@ -132,9 +273,24 @@ class ConnectionState:
     @parsable(ChatCmd.RECENT_CHAT)
     @catch_exception
     def parse_recent_chat(self, data: dict[str, Any]):
+        if self.backfill_pending:
+            self.backfill_pending = False
+            self._backfill(data.get("messageList") or list())
+
+        if not self.is_observed("recent_chat"):
+            self.skipped_messages["recent_chat"] += 1
+            return
         validated_data = RecentChat.model_validate(data)
         self.dispatch("recent_chat", validated_data)
 
+    def _backfill(self, messages: list[dict[str, Any]]) -> None:
+        missed_messages = [
+            message for message in messages if not self._is_received(message)
+        ]
+        missed_messages.sort(key=lambda x: self._message_key(x)[1])
+        self.backfilled_messages += len(missed_messages)
+        self._parse_all_type_of_chat(missed_messages)
+
     @parsable(ChatCmd.SPECIAL_CHAT)
     @catch_exception
     def parse_special_chat(self, data: list[dict[str, Any]]):
@@ -153,7 +309,18 @@ class ConnectionState:
     @parsable(ChatCmd.BLIND)
     @catch_exception
     def parse_blind(self, data: dict[str, Any]):
+        if not self.is_observed("blind") and self.message_cache is None:
+            self.skipped_messages["blind"] += 1
+            return
         validated_data = Blind.model_validate(data)
+
+        if self.message_cache is not None:
+            message = self.message_cache.get(
+                validated_data.user_id, validated_data.time
+            )
+            if isinstance(message, ChatMessage):
+                message.message_status = "BLIND"
+            validated_data._cached_message = message
         self.dispatch("blind", validated_data)
 
     @parsable(ChatCmd.EVENT)
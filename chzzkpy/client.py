@@ -25,9 +25,11 @@ from __future__ import annotations
 
 import asyncio
 
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Callable, Coroutine, Hashable, Optional, TYPE_CHECKING
+from .connection_pool import ConnectionPool
 from .http import ChzzkAPISession, NaverGameAPISession
 from .live import Live, LiveStatus, LiveDetail
+from .response_cache import ResponseCache
 from .user import User
 from .video import Video
 
@@ -36,29 +38,53 @@ if TYPE_CHECKING:
     from types import TracebackType
     from typing_extensions import Self
 
+_MISSING: Any = object()
+
 
 class Client:
-    """Represents a client to connect Chzzk (Naver Live Streaming)."""
+    """Represents a client to connect Chzzk (Naver Live Streaming).
+
+    Parameters
+    ----------
+    loop : Optional[asyncio.AbstractEventLoop]
+        The event loop of client. By default, the current event loop.
+    authorization_key : Optional[str]
+        A `NID_AUT` value in the cookie.
+    session_key : Optional[str]
+        A `NID_SES` value in the cookie.
+    response_cache : Optional[ResponseCache]
+        If it is set, the responses of `live_status` and `live_detail` are cached
+        for the polling period that the server advises.
+    connection_pool : Optional[ConnectionPool]
+        The pool of connections shared by the sessions of client.
+        If it is empty, the client creates a pool of its own and closes it with the client.
+    """
 
     def __init__(
         self,
         loop: Optional[asyncio.AbstractEventLoop] = None,
         authorization_key: Optional[str] = None,
         session_key: Optional[str] = None,
+        response_cache: Optional[ResponseCache] = None,
+        connection_pool: Optional[ConnectionPool] = None,
     ):
         self.loop = loop or asyncio.get_event_loop()
         self._closed = False
+        self.response_cache: Optional[ResponseCache] = response_cache
+        self.connection_pool: ConnectionPool = connection_pool or ConnectionPool()
+        self._connection_pool_owner = connection_pool is None
         self._api_session = None
         self._game_session = None
 
+        self._session_initial_set()
+
         if authorization_key is not None and session_key is not None:
             self.login(authorization_key, session_key)
 
-        self._session_initial_set()
-
     def _session_initial_set(self):
-        self._api_session = ChzzkAPISession(loop=self.loop)
-        self._game_session = NaverGameAPISession(loop=self.loop)
+        session_options = self.connection_pool.session_options(self.loop)
+        self._api_session = ChzzkAPISession(loop=self.loop, **session_options)
+        self._game_session = NaverGameAPISession(loop=self.loop, **session_options)
 
     async def __aenter__(self) -> Self:
         return self
@@ -72,6 +98,11 @@ class Client:
         if not self.is_closed:
             await self.close()
 
+    @property
+    def saved_requests(self) -> int:
+        """The number of REST requests saved by sharing identical requests in flight."""
+        return self._api_session.saved_requests + self._game_session.saved_requests
+
     @property
     def is_closed(self) -> bool:
         """Indicates if the session is closed."""
@@ -82,6 +113,8 @@ class Client:
         self._closed = True
         await self._api_session.close()
         await self._game_session.close()
+        if self._connection_pool_owner:
+            await self.connection_pool.close()
         return
 
     def login(self, authorization_key: str, session_key: str):
@@ -98,37 +131,79 @@ class Client:
         self._api_session.login(authorization_key, session_key)
         self._game_session.login(authorization_key, session_key)
 
-    async def live_status(self, channel_id: str) -> Optional[LiveStatus]:
+    async def _cached_request(
+        self,
+        key: Hashable,
+        request: Callable[[], Coroutine[Any, Any, Any]],
+        use_cache: bool = True,
+    ) -> Any:
+        if self.response_cache is None:
+            res = await request()
+            return res.content
+
+        if use_cache:
+            content = self.response_cache.get(key, _MISSING)
+            if content is not _MISSING:
+                return content
+
+        res = await request()
+        content = res.content
+
+        # The server advises the period to poll the status of live.
+        ttl = None
+        polling_status = getattr(content, "live_polling_status", None)
+        if polling_status is not None:
+            ttl = polling_status.call_period_millisecond / 1000
+        self.response_cache.set(key, content, ttl=ttl)
+        return content
+
+    async def live_status(
+        self, channel_id: str, use_cache: bool = True
+    ) -> Optional[LiveStatus]:
         """Get a live status info of broadcaster.
 
         Parameters
         ----------
         channel_id : str
             The channel ID of broadcaster
+        use_cache : bool
+            If it is false, the cached response is not used, and the response is fetched again.
+            It only takes effect when `response_cache` is set.
 
         Returns
         -------
         Optional[LiveStatus]
             Return LiveStatus info. Sometimes the broadcaster is not broadcasting, returns None.
         """
-        res = await self._api_session.live_status(channel_id=channel_id)
-        return res.content
-
-    async def live_detail(self, channel_id: str) -> Optional[LiveDetail]:
+        return await self._cached_request(
+            ("live_status", channel_id),
+            lambda: self._api_session.live_status(channel_id=channel_id),
+            use_cache=use_cache,
+        )
+
+    async def live_detail(
+        self, channel_id: str, use_cache: bool = True
+    ) -> Optional[LiveDetail]:
         """Get a live detail info of broadcaster.
 
         Parameters
         ----------
         channel_id : str
             The channel ID of broadcaster
+        use_cache : bool
+            If it is false, the cached response is not used, and the response is fetched again.
+            It only takes effect when `response_cache` is set.
 
         Returns
         -------
         Optional[LiveDetail]
             Return LiveDetail info. Sometimes the broadcaster is not broadcasting, returns None.
         """
-        res = await self._api_session.live_detail(channel_id=channel_id)
-        return res.content
+        return await self._cached_request(
+            ("live_detail", channel_id),
+            lambda: self._api_session.live_detail(channel_id=channel_id),
+            use_cache=use_cache,
+        )
 
     async def user(self) -> User:
         """Get my user info.
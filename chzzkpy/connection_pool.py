@@ -0,0 +1,134 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Any, Optional
+
+import aiohttp
+
+_CONNECTOR_PARAMETERS = inspect.signature(aiohttp.TCPConnector).parameters
+
+
+class ConnectionPool:
+    """Represents a pool of TCP connections shared by the REST sessions and the websocket session.
+    The connections, the DNS cache and the keep-alive pool are shared by every session that uses the pool.
+    A pool can be passed to many clients (ex. :class:`ChatClient` of many channels), and it is not closed by them.
+
+    Parameters
+    ----------
+    limit : int
+        The maximum number of connections, by default 100. If it is 0, the number is unlimited.
+    limit_per_host : int
+        The maximum number of connections to the same host, by default 0 (unlimited)
+    keepalive_timeout : float
+        The time in seconds to keep an idle connection for reuse, by default 15.0
+    ttl_dns_cache : Optional[int]
+        The time in seconds to cache resolved hosts, by default 10. If it is None, the cache never expires.
+    family : int
+        The address family to connect, by default 0 (both IPv4 and IPv6). (ex. `socket.AF_INET`)
+    happy_eyeballs_delay : Optional[float]
+        The delay in seconds before trying the next address of a host. (RFC 8305)
+        It requires aiohttp 3.10 or later.
+    interleave : Optional[int]
+        The number of addresses of the first family to try before the other family.
+        It requires aiohttp 3.10 or later.
+    connector : Optional[aiohttp.TCPConnector]
+        The connector to share instead of creating one. The other parameters are ignored.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: Optional[int] = 10,
+        family: int = 0,
+        happy_eyeballs_delay: Optional[float] = None,
+        interleave: Optional[int] = None,
+        connector: Optional[aiohttp.TCPConnector] = None,
+    ):
+        for name, value in (
+            ("happy_eyeballs_delay", happy_eyeballs_delay),
+            ("interleave", interleave),
+        ):
+            if value is not None and name not in _CONNECTOR_PARAMETERS:
+                raise ValueError(f"{name} requires aiohttp 3.10 or later.")
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.family = family
+        self.happy_eyeballs_delay = happy_eyeballs_delay
+        self.interleave = interleave
+
+        self._connector: Optional[aiohttp.TCPConnector] = connector
+        self._connector_owner = connector is None
+
+    @property
+    def closed(self) -> bool:
+        """Indicates if the connector of pool is closed."""
+        return self._connector is not None and self._connector.closed
+
+    def connector(
+        self, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> aiohttp.TCPConnector:
+        """Get the shared connector. It is created at the first call.
+
+        Parameters
+        ----------
+        loop : Optional[asyncio.AbstractEventLoop]
+            The event loop of connector.
+        """
+        if self._connector is not None and not (
+            self._connector.closed and self._connector_owner
+        ):
+            return self._connector
+
+        options: dict[str, Any] = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+            "ttl_dns_cache": self.ttl_dns_cache,
+            "family": self.family,
+        }
+        if self.happy_eyeballs_delay is not None:
+            options["happy_eyeballs_delay"] = self.happy_eyeballs_delay
+        if self.interleave is not None:
+            options["interleave"] = self.interleave
+        self._connector = aiohttp.TCPConnector(loop=loop, **options)
+        return self._connector
+
+    def session_options(
+        self, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> dict[str, Any]:
+        """Get the keyword arguments of :class:`aiohttp.ClientSession` to use the shared connector."""
+        return {"connector": self.connector(loop), "connector_owner": False}
+
+    async def close(self) -> None:
+        """Close the connector, if the pool created it."""
+        if self._connector is not None and self._connector_owner:
+            await self._connector.close()
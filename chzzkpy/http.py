@@ -24,8 +24,9 @@ SOFTWARE.
 import asyncio
 import aiohttp
 import functools
+import inspect
 import logging
-from typing import Annotated, Final, Optional
+from typing import Annotated, Any, Final, Hashable, Optional
 
 from ahttp_client import Session, get, Path, Query
 from ahttp_client.extension import get_pydantic_response_model
@@ -46,12 +47,74 @@ _user_agent: Final[str] = (
 
 
 class ChzzkSession(Session):
-    def __init__(self, base_url: str, loop: Optional[asyncio.AbstractEventLoop] = None):
-        super().__init__(base_url=base_url, loop=loop)
+    def __init__(
+        self,
+        base_url: str,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        coalesce_requests: bool = True,
+        **kwargs,
+    ):
+        super().__init__(base_url=base_url, loop=loop, **kwargs)
 
         self._authorization_key = None
         self._session_key = None
 
+        # Identical GET requests in flight share one request. (single-flight)
+        self.coalesce_requests = coalesce_requests
+        self.saved_requests: int = 0
+        self._in_flight: dict[Hashable, asyncio.Task] = dict()
+        for name, func in inspect.getmembers(self):
+            if not isinstance(func, RequestCore):
+                continue
+
+            # The requests of class are shared by every instance,
+            # so they are copied to send requests with the connections of this session.
+            request = func.copy()
+            request.session = self
+            if request.method == "GET":
+                request = self._coalesced(request)
+            setattr(self, name, request)
+
+    @staticmethod
+    def _retrieve_exception(task: asyncio.Task) -> None:
+        if not task.cancelled():
+            task.exception()
+
+    def _coalesced(self, request: RequestCore):
+        # `request` is the copy bound to this session in `__init__`.
+        signature = inspect.signature(request.func)
+
+        async def wrapper(*args, **kwargs) -> Any:
+            if not self.coalesce_requests:
+                return await request(*args, **kwargs)
+
+            try:
+                bound_argument = signature.bind(self, *args, **kwargs)
+                bound_argument.apply_defaults()
+                arguments = tuple(bound_argument.arguments.items())[1:]
+                key = (request.method, request.path, arguments)
+                hash(key)
+            except TypeError:
+                return await request(*args, **kwargs)
+
+            task = self._in_flight.get(key)
+            if task is not None:
+                self.saved_requests += 1
+            else:
+                task = asyncio.ensure_future(request(*args, **kwargs))
+                task.add_done_callback(self._retrieve_exception)
+                task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+                self._in_flight[key] = task
+
+            # A cancelled caller does not cancel the request of other callers.
+            return await asyncio.shield(task)
+
+        functools.update_wrapper(wrapper, request, updated=())
+        wrapper.before_hook = request.before_hook
+        wrapper.after_hook = request.after_hook
+        wrapper.__core__ = request
+        return wrapper
+
     def login(self, authorization_key: str, session_key: str):
         self._authorization_key = authorization_key
         self._session_key = session_key
@@ -104,8 +167,13 @@ class ChzzkSession(Session):
 
 
 class ChzzkAPISession(ChzzkSession):
-    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
-        super().__init__(base_url="https://api.chzzk.naver.com", loop=loop)
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        base_url: str = "https://api.chzzk.naver.com",
+        **kwargs,
+    ):
+        super().__init__(base_url=base_url, loop=loop, **kwargs)
 
     @get_pydantic_response_model()
     @get("/polling/v2/channels/{channel_id}/live-status", directly_response=True)
@@ -163,8 +231,13 @@ class ChzzkAPISession(ChzzkSession):
 
 
 class NaverGameAPISession(ChzzkSession):
-    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
-        super().__init__(base_url="https://comm-api.game.naver.com", loop=loop)
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        base_url: str = "https://comm-api.game.naver.com",
+        **kwargs,
+    ):
+        super().__init__(base_url=base_url, loop=loop, **kwargs)
 
     @get_pydantic_response_model()
     @get("/nng_main/v1/user/getUserStatus", directly_response=True)
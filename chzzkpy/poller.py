@@ -0,0 +1,344 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from typing import Any, Callable, Coroutine, Iterable, Optional, TYPE_CHECKING
+
+from .live import LiveStatus
+
+if TYPE_CHECKING:
+    from .client import Client
+
+_log = logging.getLogger(__name__)
+
+
+def _is_live(status: Optional[LiveStatus]) -> bool:
+    return status is not None and status.status == "OPEN"
+
+
+def _diff(before: LiveStatus, after: LiveStatus) -> dict[str, tuple[Any, Any]]:
+    result = dict()
+    for name in type(after).model_fields.keys():
+        value_before = getattr(before, name, None)
+        value_after = getattr(after, name, None)
+        if value_before != value_after:
+            result[name] = (value_before, value_after)
+    return result
+
+
+class _ChannelSchedule:
+    __slots__ = ("channel_id", "interval", "seq", "status", "call_period", "live_hours")
+
+    def __init__(self, channel_id: str, interval: float):
+        self.channel_id = channel_id
+        self.interval = interval
+        self.seq: int = 0
+        self.status: Optional[LiveStatus] = None
+        self.call_period: float = 0.0
+        self.live_hours: list[int] = [0] * 24
+
+    def usually_live(self, hour: int) -> bool:
+        # The hour before going live is included to catch the start.
+        return self.live_hours[hour] > 0 or self.live_hours[(hour + 1) % 24] > 0
+
+
+class LivePoller:
+    """Represents a poller that checks the live status of many channels and dispatches changes.
+    Checks are scheduled with a priority queue ordered by the next due time.
+    The interval of each channel adapts: it is shortened while the channel is live
+    or at the hours the channel usually goes live, and lengthened while the channel stays offline.
+    The interval is never shorter than the polling period that the server advises. (`callPeriodMilliSecond`)
+
+    Parameters
+    ----------
+    client : Client
+        The client to fetch the live status.
+    min_interval : float
+        The shortest interval in seconds between checks of a channel, by default 10.0
+    max_interval : float
+        The longest interval in seconds between checks of an inactive channel, by default 300.0
+    backoff : float
+        The factor to lengthen the interval each time an inactive channel is checked, by default 2.0
+    concurrency : int
+        The maximum number of checks in flight, by default 16
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        min_interval: float = 10.0,
+        max_interval: float = 300.0,
+        backoff: float = 2.0,
+        concurrency: int = 16,
+    ):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("max_interval must be greater than min_interval.")
+        if concurrency < 1:
+            raise ValueError("concurrency must be greater than 0.")
+
+        self.client = client
+        self.loop = client.loop
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.concurrency = concurrency
+
+        self.checks: int = 0
+        self.errors: int = 0
+
+        self._channels: dict[str, _ChannelSchedule] = dict()
+        self._queue: list[tuple[float, int, str]] = list()
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._checks: set[asyncio.Task] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._extra_event: dict[str, list[Callable[..., Coroutine[Any, Any, Any]]]] = (
+            dict()
+        )
+        self._running = False
+
+    @property
+    def channels(self) -> list[str]:
+        """A list of channel IDs that the poller checks."""
+        return list(self._channels.keys())
+
+    @property
+    def live_channels(self) -> list[str]:
+        """A list of channel IDs that were live at the latest check."""
+        return [
+            schedule.channel_id
+            for schedule in self._channels.values()
+            if _is_live(schedule.status)
+        ]
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """The metrics of poller. (channels, live, checks, errors, in_flight)"""
+        return {
+            "channels": len(self._channels),
+            "live": len(self.live_channels),
+            "checks": self.checks,
+            "errors": self.errors,
+            "in_flight": len(self._checks),
+        }
+
+    def get_status(self, channel_id: str) -> Optional[LiveStatus]:
+        """Get the live status of the latest check. If the channel is not checked yet, returns None."""
+        schedule = self._channels.get(channel_id)
+        return schedule.status if schedule is not None else None
+
+    def get_interval(self, channel_id: str) -> Optional[float]:
+        """Get the current interval in seconds between checks of the channel."""
+        schedule = self._channels.get(channel_id)
+        return schedule.interval if schedule is not None else None
+
+    def _push(self, schedule: _ChannelSchedule, due: float) -> None:
+        schedule.seq = next(self._counter)
+        heapq.heappush(self._queue, (due, schedule.seq, schedule.channel_id))
+        if self._queue[0][1] == schedule.seq:
+            self._wakeup.set()
+
+    def add_channel(
+        self, channel_id: str, live_hours: Optional[Iterable[int]] = None
+    ) -> None:
+        """Add a channel to check. The first check is spread within `min_interval`.
+
+        Parameters
+        ----------
+        channel_id : str
+            The channel ID of broadcaster
+        live_hours : Optional[Iterable[int]]
+            The hours (0-23, local time) that the channel usually goes live.
+            The poller also learns the hours from the checks.
+        """
+        if channel_id in self._channels.keys():
+            return
+
+        schedule = _ChannelSchedule(channel_id, self.min_interval)
+        for hour in live_hours or ():
+            schedule.live_hours[hour % 24] += 1
+        self._channels[channel_id] = schedule
+        self._push(schedule, time.monotonic() + random.uniform(0, self.min_interval))
+
+    def remove_channel(self, channel_id: str) -> None:
+        """Stop checking the channel.
+
+        Parameters
+        ----------
+        channel_id : str
+            The channel ID of broadcaster
+        """
+        # The entry in the queue is skipped when it is popped.
+        self._channels.pop(channel_id, None)
+
+    def _next_interval(self, schedule: _ChannelSchedule) -> float:
+        shortest = max(self.min_interval, schedule.call_period)
+        if _is_live(schedule.status) or schedule.usually_live(time.localtime().tm_hour):
+            return shortest
+        return max(shortest, min(self.max_interval, schedule.interval * self.backoff))
+
+    async def start(self) -> None:
+        """Check the channels until :meth:`close` is called."""
+        self._running = True
+        try:
+            while self._running:
+                if len(self._queue) == 0:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                due, seq, channel_id = self._queue[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                heapq.heappop(self._queue)
+                schedule = self._channels.get(channel_id)
+                if schedule is None or schedule.seq != seq:
+                    continue
+
+                await self._semaphore.acquire()
+                task = self.loop.create_task(
+                    self._check(schedule), name=f"chzzk.py: poll {channel_id}"
+                )
+                self._checks.add(task)
+                task.add_done_callback(self._check_done)
+        finally:
+            self._running = False
+            for task in list(self._checks):
+                task.cancel()
+
+    def _check_done(self, task: asyncio.Task) -> None:
+        self._checks.discard(task)
+        self._semaphore.release()
+
+    async def close(self) -> None:
+        """Stop checking the channels."""
+        self._running = False
+        self._wakeup.set()
+        for task in list(self._checks):
+            task.cancel()
+
+    async def _check(self, schedule: _ChannelSchedule) -> None:
+        try:
+            status = await self.client.live_status(schedule.channel_id, use_cache=False)
+        except Exception as exc:
+            self.errors += 1
+            _log.warning("Failed to check the live status of %s", schedule.channel_id)
+            schedule.interval = min(self.max_interval, schedule.interval * self.backoff)
+            self.dispatch("poll_error", schedule.channel_id, exc)
+        else:
+            self.checks += 1
+            self._update(schedule, status)
+            schedule.interval = self._next_interval(schedule)
+
+        if self._channels.get(schedule.channel_id) is schedule:
+            self._push(schedule, time.monotonic() + schedule.interval)
+
+    def _update(self, schedule: _ChannelSchedule, status: Optional[LiveStatus]) -> None:
+        previous = schedule.status
+        schedule.status = status
+        if status is not None and status.live_polling_status is not None:
+            schedule.call_period = (
+                status.live_polling_status.call_period_millisecond / 1000
+            )
+
+        channel_id = schedule.channel_id
+        if _is_live(status) and not _is_live(previous):
+            schedule.live_hours[time.localtime().tm_hour] += 1
+            self.dispatch("live_start", channel_id, status)
+        elif not _is_live(status) and _is_live(previous):
+            self.dispatch("live_end", channel_id, previous)
+        elif _is_live(status):
+            diff = _diff(previous, status)
+            if len(diff) > 0:
+                self.dispatch("live_update", channel_id, status, diff)
+
+    # Event Handler
+    def event(
+        self, coro: Callable[..., Coroutine[Any, Any, Any]]
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        """A decorator that registers an event to listen to.
+        The function must be corutine. Else client cause TypeError
+
+        A list of events that the poller can listen to.
+        * `on_live_start`: Called with the channel ID and :class:`LiveStatus` when a channel goes live.
+        * `on_live_end`: Called with the channel ID and the last :class:`LiveStatus` while live
+                            when a channel stops broadcasting.
+        * `on_live_update`: Called with the channel ID, :class:`LiveStatus` and the changed fields
+                            as `{name: (before, after)}` while a channel is live.
+        * `on_poll_error`: Called with the channel ID and the exception when a check fails.
+
+        Example
+        -------
+        >>> @poller.event
+        ... async def on_live_update(channel_id: str, status: LiveStatus, diff: dict):
+        ...     if "concurrent_user_count" in diff:
+        ...         print(channel_id, diff["concurrent_user_count"])
+        """
+        if not asyncio.iscoroutinefunction(coro):
+            raise TypeError("function must be a coroutine.")
+
+        event_name = coro.__name__
+        if event_name not in self._extra_event.keys():
+            self._extra_event[event_name] = list()
+        self._extra_event[event_name].append(coro)
+        return coro
+
+    def dispatch(self, event: str, *args: Any, **kwargs) -> None:
+        _log.debug("Dispatching event %s", event)
+        method = "on_" + event
+        for coroutine_function in self._extra_event.get(method, list()):
+            task = self.loop.create_task(
+                self._run_event(coroutine_function, method, *args, **kwargs),
+                name=f"chzzk.py: {method}",
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _run_event(
+        coro: Callable[..., Coroutine[Any, Any, Any]],
+        event_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        try:
+            await coro(*args, **kwargs)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            _log.exception("Ignoring exception in %s", event_name)
@@ -0,0 +1,113 @@
+"""MIT License
+
+Copyright (c) 2024 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ResponseCache:
+    """Represents a bounded LRU of REST responses that expire after a TTL.
+    :meth:`Client.live_status` and :meth:`Client.live_detail` cache their responses
+    for the polling period that the server advises. (`callPeriodMilliSecond`)
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum number of cached responses, by default 1000
+    default_ttl : float
+        The time in seconds to keep a response without the advised polling period, by default 10.0
+    """
+
+    def __init__(self, max_size: int = 1000, default_ttl: float = 10.0):
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0.")
+
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self._responses: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """The metrics of response cache. (size, hits, misses)"""
+        return {"size": len(self._responses), "hits": self.hits, "misses": self.misses}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the cached response. An expired response is removed.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of request. (ex. `("live_status", channel_id)`)
+        default : Any
+            The value returned if the response is not cached or expired, by default None
+        """
+        entry = self._responses.get(key)
+        if entry is not None:
+            expires_at, response = entry
+            if expires_at > time.monotonic():
+                self._responses.move_to_end(key)
+                self.hits += 1
+                return response
+            del self._responses[key]
+
+        self.misses += 1
+        return default
+
+    def set(self, key: Hashable, response: Any, ttl: Optional[float] = None) -> None:
+        """Cache the response.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of request.
+        response : Any
+            The response to cache. None is cached too. (ex. the broadcaster is not broadcasting)
+        ttl : Optional[float]
+            The time in seconds to keep the response. If it is None, `default_ttl` is used.
+        """
+        if ttl is None:
+            ttl = self.default_ttl
+        if ttl <= 0:
+            self._responses.pop(key, None)
+            return
+
+        self._responses[key] = (time.monotonic() + ttl, response)
+        self._responses.move_to_end(key)
+        if len(self._responses) > self.max_size:
+            self._responses.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove the cached response of the key."""
+        self._responses.pop(key, None)
+
+    def clear(self) -> None:
+        self._responses.clear()
@@ -0,0 +1,52 @@
+import asyncio
+import unittest
+
+from chzzkpy.chat import ChatClient, EventExecutor, FakeChatServer
+from chzzkpy.chat.access_token import AccessToken
+
+
+class HeartbeatTest(unittest.IsolatedAsyncioTestCase):
+    async def test_backpressure_does_not_close_healthy_connection(self):
+        async with FakeChatServer(
+            rate=200, message_types={"chat": 1.0}, seed=1
+        ) as server:
+            client = ChatClient(
+                "channel_id",
+                chat_channel_id="chat_channel_id",
+                chat_server_url=server.url,
+                event_executor=EventExecutor(
+                    workers=1, max_queue_size=10, overflow="block"
+                ),
+                heartbeat_interval=0.1,
+                max_missed_heartbeats=2,
+            )
+            client.access_token = AccessToken.model_validate(
+                {
+                    "accessToken": "access_token",
+                    "temporaryRestrict": {"temporaryRestrict": False, "times": 0},
+                    "realNameAuth": False,
+                    "extraToken": "extra_token",
+                }
+            )
+
+            @client.event
+            async def on_chat(_):
+                # A slow handler makes the executor block the websocket reader.
+                await asyncio.sleep(0.2)
+
+            task = asyncio.create_task(client.polling())
+            try:
+                await asyncio.wait_for(client.wait_until_connected(), timeout=5.0)
+                await asyncio.sleep(1.5)
+
+                self.assertTrue(client.is_connected)
+                self.assertEqual(server.connection_count, 1)
+                self.assertEqual(client.reconnect_metrics["reconnect_count"], 0)
+            finally:
+                await client.close()
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+
+if __name__ == "__main__":
+    unittest.main()